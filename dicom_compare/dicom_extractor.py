@@ -1,14 +1,25 @@
 import zipfile
 import tempfile
 import os
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
-from rich.console import Console
+from rich.console import Console, Group
+from rich.text import Text
 import pydicom
 
+from dicom_compare.utils import create_temp_dir
+
 console = Console()
 
+# Upper bound on concurrent ZIP extractions (zlib releases the GIL while inflating)
+DEFAULT_EXTRACT_JOBS = 8
+
+def member_extract_jobs(archive_jobs: int) -> int:
+    """Threads per archive for its members, when archive_jobs archives are extracted at once"""
+    return max(1, DEFAULT_EXTRACT_JOBS // max(archive_jobs, 1))
+
 @dataclass
 class ExtractionStats:
     """Statistics from ZIP extraction"""
@@ -24,37 +35,18 @@ class DicomExtractor:
         self.verbose = verbose
         self.dicom_extensions = {'.dcm', '.dicom', '.dic', ''}
     
-    def extract_zip(self, zip_path: Path, extract_to: Path) -> Tuple[Path, ExtractionStats]:
-        """Extract ZIP file and return path + extraction statistics"""
+    def extract_zip(self, zip_path: Path, extract_to: Path, member_jobs: int = 1) -> Tuple[Path, ExtractionStats]:
+        """
+        Extract ZIP file and return path + extraction statistics
+        
+        member_jobs is the number of threads inflating and writing this archive's members.
+        """
         try:
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                file_list = zip_ref.namelist()
-                
-                # Count directories and files
-                directories = set()
-                files = []
-                for item in file_list:
-                    if item.endswith('/'):
-                        directories.add(item.rstrip('/'))
-                    else:
-                        files.append(item)
-                        # Get directory part
-                        dir_part = str(Path(item).parent)
-                        if dir_part != '.' and dir_part != '':
-                            directories.add(dir_part)
+                directories, files = self._split_members(zip_ref.namelist())
+                console.print(Group(*self._summary_lines(zip_path, directories, files)))
                 
-                # Show basic summary (always)
-                console.print(f"   {zip_path.name}: {len(directories)} folders, {len(files)} files", style="cyan")
-                
-                if self.verbose:
-                    # Show detailed contents only in verbose mode
-                    console.print(f"     📂 Directories found:", style="dim")
-                    for directory in sorted(directories)[:10]:
-                        console.print(f"        {directory}/", style="dim")
-                    if len(directories) > 10:
-                        console.print(f"        ... and {len(directories) - 10} more directories", style="dim")
-                
-                zip_ref.extractall(extract_to)
+                self._extract_members(zip_ref, extract_to, member_jobs)
             
             if self.verbose:
                 self._debug_directory_structure(extract_to)
@@ -74,6 +66,128 @@ class DicomExtractor:
         except Exception as e:
             raise ValueError(f"Failed to extract {zip_path}: {str(e)}")
     
+    def _extract_members(self, zip_ref: zipfile.ZipFile, extract_to: Path, jobs: int) -> None:
+        """
+        Extract every member of an open ZIP file, up to `jobs` at a time
+        
+        zlib and file writes release the GIL, so a few threads keep the disk busy
+        on archives of many small DICOMs. Directory entries and the first file of
+        each folder are extracted up front, so the threads never race to create
+        the same directory.
+        """
+        if jobs <= 1:
+            zip_ref.extractall(extract_to)
+            return
+        
+        seen_folders = set()
+        remaining = []
+        for info in zip_ref.infolist():
+            folder = info.filename.rpartition('/')[0]
+            if info.is_dir() or folder not in seen_folders:
+                seen_folders.add(folder)
+                zip_ref.extract(info, extract_to)
+            else:
+                remaining.append(info)
+        
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            # list() so an extraction error is raised here
+            list(executor.map(lambda info: zip_ref.extract(info, extract_to), remaining))
+    
+    def _split_members(self, file_list: List[str]) -> Tuple[set, List[str]]:
+        """Split ZIP member names into folders and files"""
+        # Count directories and files
+        directories = set()
+        files = []
+        for item in file_list:
+            if item.endswith('/'):
+                directories.add(item.rstrip('/'))
+            else:
+                files.append(item)
+                # Get directory part
+                dir_part = str(Path(item).parent)
+                if dir_part != '.' and dir_part != '':
+                    directories.add(dir_part)
+        
+        return directories, files
+    
+    def _summary_lines(self, zip_path: Path, directories: set, files: List[str]) -> List[Text]:
+        """Archive summary lines (folder and file counts, plus the folders in verbose mode)"""
+        # Show basic summary (always)
+        lines = [Text(f"   {zip_path.name}: {len(directories)} folders, {len(files)} files", style="cyan")]
+        
+        if self.verbose:
+            # Show detailed contents only in verbose mode
+            lines.append(Text(f"     📂 Directories found:", style="dim"))
+            for directory in sorted(directories)[:10]:
+                lines.append(Text(f"        {directory}/", style="dim"))
+            if len(directories) > 10:
+                lines.append(Text(f"        ... and {len(directories) - 10} more directories", style="dim"))
+        
+        return lines
+    
+    def find_dicom_members(self, zip_path: Path) -> Tuple[List[str], ExtractionStats, List[Text]]:
+        """
+        List the DICOM files inside a ZIP file without extracting it
+        
+        Only the start of each member is inflated to look for DICOM markers, so
+        listing an archive needs no temp directory or disk writes. Nothing is
+        printed, so archives can be scanned concurrently and each summary shown
+        with the rest of that archive's output.
+        
+        Returns:
+            (sorted DICOM member names, extraction statistics, archive summary lines)
+        """
+        try:
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                directories, files = self._split_members(zip_ref.namelist())
+                
+                dicom_members = [
+                    info.filename for info in zip_ref.infolist()
+                    if not info.is_dir() and self._is_likely_dicom_member(zip_ref, info)
+                ]
+        except zipfile.BadZipFile:
+            raise ValueError(f"Invalid ZIP file: {zip_path}")
+        
+        stats = ExtractionStats(
+            total_files=len(files),
+            total_folders=len(directories),
+            dicom_files=len(dicom_members),
+            non_dicom_files=len(files) - len(dicom_members)
+        )
+        
+        # Same order as find_dicom_files gives for the extracted tree
+        return sorted(dicom_members, key=PurePosixPath), stats, self._summary_lines(zip_path, directories, files)
+    
+    def extract_zips(self, zip_paths: List[Path], temp_dirs: List[Path],
+                     jobs: Optional[int] = None) -> List[Tuple[Path, ExtractionStats]]:
+        """
+        Extract several ZIP files concurrently, each into its own temp directory
+        
+        Args:
+            zip_paths: ZIP files to extract
+            temp_dirs: List the created temp directories are appended to, for cleanup
+            jobs: Number of extraction threads (defaults to one per file, up to DEFAULT_EXTRACT_JOBS)
+        
+        Returns:
+            (extracted_path, stats) for each ZIP, in input order
+        """
+        targets = []
+        for _ in zip_paths:
+            temp_dir = create_temp_dir()
+            temp_dirs.append(temp_dir)
+            targets.append(temp_dir)
+        
+        if jobs is None:
+            jobs = min(DEFAULT_EXTRACT_JOBS, len(zip_paths))
+        # Archives extracted side by side share the thread budget for their members
+        member_jobs = member_extract_jobs(jobs)
+        
+        if jobs <= 1 or len(zip_paths) <= 1:
+            return [self.extract_zip(zip_path, target, member_jobs) for zip_path, target in zip(zip_paths, targets)]
+        
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            return list(executor.map(self.extract_zip, zip_paths, targets, [member_jobs] * len(zip_paths)))
+    
     def _debug_directory_structure(self, root_path: Path):
         """Debug the extracted directory structure (verbose only)"""
         if not self.verbose:
@@ -174,53 +288,73 @@ class DicomExtractor:
                 console.print(f"      ⚠️  Error checking {file_path.name}: {e}", style="yellow")
             return False
     
+    def _is_likely_dicom_member(self, zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo) -> bool:
+        """Check if a ZIP member is likely a DICOM file, reading it from the archive"""
+        try:
+            # Same extension and size rules as _is_likely_dicom
+            skip_extensions = {'.txt', '.xml', '.json', '.log', '.zip', '.rar', '.tar', '.gz', '.md', '.pdf'}
+            if PurePosixPath(info.filename).suffix.lower() in skip_extensions:
+                return False
+            if info.file_size < 128:
+                return False
+            
+            with zip_ref.open(info) as f:
+                return self._check_dicom_stream(f, info.file_size)
+            
+        except Exception as e:
+            if self.verbose:
+                console.print(f"      ⚠️  Error checking {info.filename}: {e}", style="yellow")
+            return False
+    
     def _check_dicom_header(self, file_path: Path) -> bool:
         """Check if file has DICOM header"""
         try:
             with open(file_path, 'rb') as f:
-                file_size = file_path.stat().st_size
-                
-                # Method 1: Check DICM at position 128
-                if file_size >= 132:
-                    f.seek(128)
-                    prefix = f.read(4)
-                    if prefix == b'DICM':
-                        if self.verbose:
-                            console.print(f"         Found DICM header at position 128", style="dim")
-                        return True
-                
-                # Method 2: Check for DICM anywhere in first 1KB
-                f.seek(0)
-                header = f.read(min(1024, file_size))
-                if b'DICM' in header:
-                    if self.verbose:
-                        console.print(f"         Found DICM in header", style="dim")
-                    return True
-                
-                # Method 3: Look for DICOM patterns
-                dicom_patterns = [b'1.2.840.10008', b'DICOM']
-                for pattern in dicom_patterns:
-                    if pattern in header:
-                        if self.verbose:
-                            console.print(f"         Found DICOM pattern: {pattern}", style="dim")
-                        return True
-                
-                # Method 4: Try pydicom parse
-                f.seek(0)
-                try:
-                    ds = pydicom.dcmread(f, stop_before_pixels=True, force=True)
-                    if hasattr(ds, 'SOPInstanceUID') or hasattr(ds, 'StudyInstanceUID'):
-                        if self.verbose:
-                            console.print(f"         Parsed with pydicom", style="dim")
-                        return True
-                except:
-                    pass
-                
-                if self.verbose:
-                    console.print(f"         No DICOM markers found", style="dim")
-                return False
+                return self._check_dicom_stream(f, file_path.stat().st_size)
                 
         except Exception as e:
             if self.verbose:
                 console.print(f"         Error reading file: {e}", style="yellow")
-            return False
\ No newline at end of file
+            return False
+    
+    def _check_dicom_stream(self, f, file_size: int) -> bool:
+        """Check an open binary stream for DICOM markers"""
+        # Method 1: Check DICM at position 128
+        if file_size >= 132:
+            f.seek(128)
+            prefix = f.read(4)
+            if prefix == b'DICM':
+                if self.verbose:
+                    console.print(f"         Found DICM header at position 128", style="dim")
+                return True
+        
+        # Method 2: Check for DICM anywhere in first 1KB
+        f.seek(0)
+        header = f.read(min(1024, file_size))
+        if b'DICM' in header:
+            if self.verbose:
+                console.print(f"         Found DICM in header", style="dim")
+            return True
+        
+        # Method 3: Look for DICOM patterns
+        dicom_patterns = [b'1.2.840.10008', b'DICOM']
+        for pattern in dicom_patterns:
+            if pattern in header:
+                if self.verbose:
+                    console.print(f"         Found DICOM pattern: {pattern}", style="dim")
+                return True
+        
+        # Method 4: Try pydicom parse
+        f.seek(0)
+        try:
+            ds = pydicom.dcmread(f, stop_before_pixels=True, force=True)
+            if hasattr(ds, 'SOPInstanceUID') or hasattr(ds, 'StudyInstanceUID'):
+                if self.verbose:
+                    console.print(f"         Parsed with pydicom", style="dim")
+                return True
+        except:
+            pass
+        
+        if self.verbose:
+            console.print(f"         No DICOM markers found", style="dim")
+        return False
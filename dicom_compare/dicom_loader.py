@@ -1,6 +1,9 @@
+import sys
+import zipfile
+from io import BytesIO
 import pydicom
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, BinaryIO
 from dataclasses import dataclass, field
 from collections import defaultdict
 from rich.console import Console
@@ -32,8 +35,9 @@ class DicomStudy:
 class DicomLoader:
     """Loads and organizes DICOM files into hierarchical structure"""
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, show_progress: bool = True):
         self.verbose = verbose
+        self.show_progress = show_progress  # Disabled in worker processes so bars don't interleave
         self.failed_files = []
     
     def load_dicom_files(self, root_path: Path, source_file_name: str) -> Dict[str, DicomStudy]:
@@ -56,7 +60,8 @@ class DicomLoader:
         self.failed_files = []
         
         # Load each DICOM file
-        for file_path in track(dicom_files, description=f"Loading DICOMs from {source_file_name[:20]}..."):
+        for file_path in track(dicom_files, description=f"Loading DICOMs from {source_file_name[:20]}...",
+                               disable=not self.show_progress):
             try:
                 dicom_instance = self._load_dicom_file(file_path, source_file_name)
                 if dicom_instance:
@@ -70,20 +75,22 @@ class DicomLoader:
         
         return studies
     
-    def _load_dicom_file(self, file_path: Path, source_file_name: str) -> Optional[DicomInstance]:
+    def _load_dicom_file(self, file_path: Path, source_file_name: str,
+                         open_member: Optional[Callable[[Path], BinaryIO]] = None) -> Optional[DicomInstance]:
         """
         Load single DICOM file and extract relevant information
         
         Args:
             file_path: Path to DICOM file
             source_file_name: Name of source ZIP file
+            open_member: Reads file_path from somewhere other than disk (e.g. a ZIP member)
             
         Returns:
             DicomInstance or None if failed to load
         """
         try:
             # Load DICOM file
-            ds = pydicom.dcmread(file_path, force=True)
+            ds = pydicom.dcmread(open_member(file_path) if open_member else file_path, force=True)
             
             # Extract required UIDs
             sop_instance_uid = self._safe_get_tag(ds, 'SOPInstanceUID')
@@ -137,8 +144,10 @@ class DicomLoader:
                 if element.tag in [(0x7fe0, 0x0010)]:  # Pixel Data
                     continue
                 
-                tag_name = f"({element.tag.group:04x},{element.tag.element:04x})"
-                keyword = element.keyword if element.keyword else tag_name
+                # Standard keywords come from pydicom's dictionary and are already shared;
+                # tag-number keys of private elements are interned so each instance's tags
+                # dict (and every TagDifference built from it) reuses one string per tag
+                keyword = element.keyword or sys.intern(f"({element.tag.group:04x},{element.tag.element:04x})")
                 
                 # Handle different value types
                 if element.VR == 'SQ':  # Sequence
@@ -216,6 +225,29 @@ class DicomLoader:
         extractor = DicomExtractor(verbose=self.verbose)
         dicom_files = extractor.find_dicom_files(root_path)
         
+        return self._load_instances(dicom_files, source_file_name)
+    
+    def load_dicom_zip(self, zip_path: Path, members: List[str], source_file_name: str) -> Dict[str, DicomStudy]:
+        """
+        Load DICOM members straight out of a ZIP file, without extracting it to disk
+        
+        Instance file paths are the member names, so this only suits callers that
+        never reopen the files (UID matching does not; pixel matching does).
+        
+        Args:
+            zip_path: ZIP file to read
+            members: DICOM member names, as listed by DicomExtractor.find_dicom_members
+            source_file_name: Name of source ZIP file for tracking
+        """
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            return self._load_instances(
+                [Path(member) for member in members], source_file_name,
+                open_member=lambda member: BytesIO(zip_ref.read(member.as_posix()))
+            )
+    
+    def _load_instances(self, dicom_files: List[Path], source_file_name: str,
+                        open_member: Optional[Callable[[Path], BinaryIO]] = None) -> Dict[str, DicomStudy]:
+        """Load the given DICOM files and organize them by Study -> Series -> Instance"""
         studies = {}
         self.failed_files = []
         successful_loads = 0
@@ -226,7 +258,7 @@ class DicomLoader:
                 if self.verbose:
                     console.print(f"   Loading {i+1}/{len(dicom_files)}: {file_path.name}...", style="dim")
                 
-                dicom_instance = self._load_dicom_file(file_path, source_file_name)
+                dicom_instance = self._load_dicom_file(file_path, source_file_name, open_member)
                 if dicom_instance:
                     self._organize_instance(dicom_instance, studies)
                     successful_loads += 1
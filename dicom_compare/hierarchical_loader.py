@@ -1,3 +1,7 @@
+import hashlib
+import os
+import pickle
+import tempfile
 import pydicom
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set
@@ -9,16 +13,27 @@ from dicom_compare.models import (
     HierarchicalDicomData, PatientInfo, StudyInfo, SeriesInfo, InstanceInfo, TagInfo
 )
 from dicom_compare.dicom_extractor import DicomExtractor
-from dicom_compare.utils import create_temp_dir, cleanup_temp_dirs
+from dicom_compare.utils import cleanup_temp_dirs
 
 console = Console()
 
+# Bump whenever HierarchicalDicomData or the tag categorization changes so old caches are ignored
+CACHE_VERSION = 2
+# Number of cached hierarchies kept on disk; older ones are pruned on write
+CACHE_MAX_ENTRIES = 20
+
+def default_cache_dir() -> Path:
+    """Directory for cached hierarchies (honours XDG_CACHE_HOME)"""
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'dicom-compare'
+
 class HierarchicalDicomLoader:
     """Loads DICOM files and organizes into hierarchical structure with tag categorization"""
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, use_cache: bool = True, cache_dir: Optional[Path] = None):
         self.verbose = verbose
         self.failed_files = []
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir or default_cache_dir()
 
         # Define tag categorization
         self.patient_tags = self._get_patient_level_tags()
@@ -36,21 +51,37 @@ class HierarchicalDicomLoader:
         Returns:
             HierarchicalDicomData with organized DICOM metadata
         """
+        if not self.use_cache:
+            return self._load_from_zips(files)
+
+        # Loaded hierarchies hold no references to the extracted files, so they can be
+        # reused by later inspect runs on the same (unchanged) ZIP files
+        cache_path = self._cache_path(files)
+        data = self._read_cache(cache_path)
+        if data is not None:
+            console.print(f"♻️  Using cached DICOM data for {len(files)} file(s)", style="cyan")
+            self.failed_files = []
+            return data
+
+        data = self._load_from_zips(files)
+        self._write_cache(cache_path, data)
+        return data
+
+    def _load_from_zips(self, files: List[Path]) -> HierarchicalDicomData:
+        """Extract the ZIP files and build the hierarchy from their DICOM files"""
         data = HierarchicalDicomData()
         temp_dirs = []
 
         try:
             extractor = DicomExtractor(verbose=False)  # Always quiet for hierarchical loading
 
-            for file in files:
+            # Extract all ZIP files up front, in parallel
+            extracted = extractor.extract_zips(files, temp_dirs)
+
+            for file, (extracted_path, stats) in zip(files, extracted):
                 if self.verbose:
                     console.print(f"📦 Processing {file.name}...", style="cyan")
 
-                temp_dir = create_temp_dir()
-                temp_dirs.append(temp_dir)
-
-                # Extract ZIP file
-                extracted_path, stats = extractor.extract_zip(file, temp_dir)
                 dicom_files = extractor.find_dicom_files(extracted_path)
 
                 if not dicom_files:
@@ -95,6 +126,48 @@ class HierarchicalDicomLoader:
         finally:
             cleanup_temp_dirs(temp_dirs)
 
+    def _cache_path(self, files: List[Path]) -> Path:
+        """Cache file for these inputs, keyed by path, size and modification time of each ZIP"""
+        key = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+        for file in files:
+            stat = file.stat()
+            key.update(f"\0{file.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}".encode())
+        return self.cache_dir / f"{key.hexdigest()}.pkl"
+
+    def _read_cache(self, cache_path: Path) -> Optional[HierarchicalDicomData]:
+        """Load a cached hierarchy, or None if there is no usable one"""
+        try:
+            with open(cache_path, 'rb') as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            if self.verbose:
+                console.print(f"⚠️  Ignoring unreadable cache {cache_path.name}: {e}", style="yellow")
+            return None
+        return data if isinstance(data, HierarchicalDicomData) else None
+
+    def _write_cache(self, cache_path: Path, data: HierarchicalDicomData) -> None:
+        """Store a hierarchy atomically and prune the oldest cache entries"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, cache_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+
+            entries = sorted(self.cache_dir.glob('*.pkl'), key=lambda p: p.stat().st_mtime, reverse=True)
+            for stale in entries[CACHE_MAX_ENTRIES:]:
+                stale.unlink(missing_ok=True)
+        except Exception as e:
+            # Caching is best effort; the freshly loaded data is still returned
+            if self.verbose:
+                console.print(f"⚠️  Could not write cache: {e}", style="yellow")
+
     def _process_dicom_file(self, dicom_file: Path, source_file: str,
                           extracted_path: Path, data: HierarchicalDicomData):
         """Process a single DICOM file and add to hierarchical data"""
@@ -190,11 +263,11 @@ class HierarchicalDicomLoader:
 
         # Update series instance counts
         for series in data.series.values():
-            series.instances = list(set(series.instances))  # Remove duplicates
+            series.instances = list(dict.fromkeys(series.instances))  # Remove duplicates, keeping load order
 
         # Update study instance counts
         for study in data.studies.values():
-            study.series = list(set(study.series))  # Remove duplicates
+            study.series = list(dict.fromkeys(study.series))  # Remove duplicates, keeping load order
             study.total_instances = sum(
                 len(data.series[series_uid].instances)
                 for series_uid in study.series
@@ -203,7 +276,7 @@ class HierarchicalDicomLoader:
 
         # Update patient instance counts
         for patient in data.patients.values():
-            patient.studies = list(set(patient.studies))  # Remove duplicates
+            patient.studies = list(dict.fromkeys(patient.studies))  # Remove duplicates, keeping load order
             patient.total_instances = sum(
                 data.studies[study_uid].total_instances
                 for study_uid in patient.studies
@@ -6,18 +6,12 @@ import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.chart import PieChart, BarChart, ScatterChart, Reference
-from openpyxl.chart.series import DataPoint
-import pandas as pd
-import numpy as np
 
 from .image_comparator import ImageComparator
 from .image_models import ImageComparisonSummary, ImageFileComparisonResult
 from .dicom_extractor import DicomExtractor
 from .dicom_loader import DicomLoader
-from .utils import validate_inputs, create_temp_dir, cleanup_temp_dirs
+from .utils import validate_inputs, cleanup_temp_dirs, CSV_BUFFER_SIZE
 
 console = Console()
 
@@ -26,7 +20,10 @@ def run_image_comparison(
     report: Optional[Path] = None,
     tolerance: float = 0.0,
     normalize: bool = True,
-    verbose: bool = False
+    verbose: bool = False,
+    decoder: Optional[str] = None,
+    quick_reject: bool = False,
+    jobs: Optional[int] = None
 ) -> None:
     """Main image comparison workflow"""
     
@@ -49,10 +46,7 @@ def run_image_comparison(
         extractor = DicomExtractor(verbose=verbose)
         extracted_paths = []
         
-        for file in files:
-            temp_dir = create_temp_dir()
-            temp_dirs.append(temp_dir)
-            extracted_path, stats = extractor.extract_zip(file, temp_dir)
+        for file, (extracted_path, stats) in zip(files, extractor.extract_zips(files, temp_dirs, jobs)):
             extracted_paths.append((str(file), extracted_path))
             extraction_stats.append((str(file), stats))
         
@@ -79,17 +73,17 @@ def run_image_comparison(
         
         # Image comparison
         console.print("🔍 Comparing image pixel data...", style="yellow")
-        image_comparator = ImageComparator(tolerance=tolerance, normalize=normalize)
+        image_comparator = ImageComparator(
+            tolerance=tolerance, normalize=normalize,
+            decoding_plugin=decoder, quick_reject=quick_reject
+        )
         
         baseline_name, baseline_studies = loaded_studies[0]
-        comparison_results = []
         
-        for comp_name, comp_studies in loaded_studies[1:]:
-            result = image_comparator.compare_studies(
-                baseline_studies, comp_studies,
-                baseline_name, comp_name
-            )
-            comparison_results.append(result)
+        # All comparison files in one pass, so each baseline image is decoded once
+        comparison_results = image_comparator.compare_study_sets(
+            baseline_studies, loaded_studies[1:], baseline_name
+        )
         
         # Create summary
         summary = create_image_comparison_summary(baseline_name, comparison_results, tolerance, normalize)
@@ -146,7 +140,7 @@ def display_image_terminal_results(summary: ImageComparisonSummary, console: Con
     # Create summary panel
     summary_text = f"Baseline: {Path(summary.baseline_file).name}\n"
     summary_text += f"Comparison Mode: Image Pixel Data\n"
-    summary_text += f"Tolerance: {summary.tolerance_used}\n"
+    summary_text += f"Tolerance: {summary.tolerance_used} ({summary.tolerance_units})\n"
     summary_text += f"Normalization: {'Applied' if summary.normalization_applied else 'Disabled'}\n"
     summary_text += f"Images Compared: {summary.total_images_compared}"
     
@@ -174,7 +168,7 @@ def display_image_terminal_results(summary: ImageComparisonSummary, console: Con
         match_pct = (exact_matches / total_baseline * 100) if total_baseline > 0 else 0
         
         table.add_row(
-            Path(result.comparison_file).name,
+            result.comparison_name,
             str(exact_matches),
             str(pixel_diffs),
             f"{avg_similarity:.1%}",
@@ -185,6 +179,14 @@ def display_image_terminal_results(summary: ImageComparisonSummary, console: Con
     
     console.print(table)
     
+    # Quick-reject results are subsample estimates; say so rather than mix them in silently
+    approximate = sum(result.approximate_count for result in summary.file_results)
+    if approximate:
+        console.print(
+            f"⚠️  {approximate} comparison(s) were rejected by --quick-reject: their statistics are "
+            f"estimated from a pixel subsample (marked Approximate in reports)", style="yellow"
+        )
+    
     # Add detailed statistics if there are differences
     _display_image_statistics(summary, console)
 
@@ -230,39 +232,52 @@ def generate_image_report(summary: ImageComparisonSummary, report_path: Path) ->
 
 def generate_image_csv_report(summary: ImageComparisonSummary, report_path: Path) -> None:
     """Generate CSV report for image comparisons"""
-    import pandas as pd
+    import csv
     
-    rows = []
     headers = ['BaselineFile', 'ComparisonFile', 'SOPInstanceUID', 'ExactMatch', 
               'SimilarityScore', 'PixelDifferences', 'MaxDifference', 'MeanDifference',
-              'RMSE', 'BaselineShape', 'ComparisonShape', 'DifferenceType', 'ToleranceUsed']
+              'RMSE', 'BaselineShape', 'ComparisonShape', 'DifferenceType', 'ToleranceUsed',
+              'Approximate']
     
-    for result in summary.file_results:
-        for img_comp in result.image_comparisons:
-            rows.append([
-                Path(result.baseline_file).name,
-                Path(result.comparison_file).name,
-                img_comp.sop_instance_uid,
-                img_comp.is_exact_match,
-                f"{img_comp.similarity_score:.4f}",
-                img_comp.pixel_differences,
-                img_comp.max_difference,
-                img_comp.mean_difference,
-                img_comp.rmse,
-                str(img_comp.baseline_stats.shape) if img_comp.baseline_stats else "N/A",
-                str(img_comp.comparison_stats.shape) if img_comp.comparison_stats else "N/A",
-                img_comp.difference_type.value,
-                img_comp.tolerance_used
-            ])
-    
-    df = pd.DataFrame(rows, columns=headers)
-    df.to_csv(report_path, index=False)
-    
-    console.print(f"📊 Generated CSV with {len(rows)} image comparisons", style="cyan")
+    # Stream rows straight to disk rather than building a DataFrame first
+    row_count = 0
+    with open(report_path, 'w', newline='', buffering=CSV_BUFFER_SIZE) as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(headers)
+        
+        for result in summary.file_results:
+            baseline_name = result.baseline_name
+            comparison_name = result.comparison_name
+            
+            for img_comp in result.image_comparisons:
+                baseline_stats = img_comp.baseline_stats
+                comparison_stats = img_comp.comparison_stats
+                writer.writerow((
+                    baseline_name,
+                    comparison_name,
+                    img_comp.sop_instance_uid,
+                    img_comp.is_exact_match,
+                    f"{img_comp.similarity_score:.4f}",
+                    img_comp.pixel_differences,
+                    img_comp.max_difference,
+                    img_comp.mean_difference,
+                    img_comp.rmse,
+                    str(baseline_stats.shape) if baseline_stats else "N/A",
+                    str(comparison_stats.shape) if comparison_stats else "N/A",
+                    img_comp.difference_type.value,
+                    img_comp.tolerance_used,
+                    img_comp.is_approximate
+                ))
+                row_count += 1
+    
+    console.print(f"📊 Generated CSV with {row_count} image comparisons", style="cyan")
 
 def generate_image_excel_report(summary: ImageComparisonSummary, report_path: Path) -> None:
     """Generate comprehensive Excel report for image comparisons"""   
     try:
+        # Report dependencies are imported lazily so the terminal-only path starts fast
+        import openpyxl
+
         console.print("📊 Creating Excel image comparison report...", style="cyan")
         
         # Create workbook
@@ -299,16 +314,24 @@ def generate_image_excel_report(summary: ImageComparisonSummary, report_path: Pa
 
 def _create_image_summary_worksheet(ws, summary: ImageComparisonSummary) -> None:
     """Create image comparison summary worksheet with charts"""
+    from openpyxl.styles import Font, PatternFill, Alignment
+    from datetime import datetime
+
     ws.title = "Image Summary"
     
     # Styling
-    header_font = Font(name='Calibri', size=16, bold=True, color='FFFFFF')
-    header_fill = PatternFill(start_color='2F5597', end_color='2F5597', fill_type='solid')
-    subheader_font = Font(name='Calibri', size=12, bold=True, color='2F5597')
+    header_font = Font(name='Calibri', size=16, bold=True, color='FFFFFFFF')
+    header_fill = PatternFill(start_color='FF2F5597', end_color='FF2F5597', fill_type='solid')
+    subheader_font = Font(name='Calibri', size=12, bold=True, color='FF2F5597')
+    label_font = Font(bold=True)
+    header_alignment = Alignment(horizontal='center')
+    good_fill = PatternFill(start_color='FFC6EFCE', end_color='FFC6EFCE', fill_type='solid')
+    fair_fill = PatternFill(start_color='FFFFEB9C', end_color='FFFFEB9C', fill_type='solid')
+    poor_fill = PatternFill(start_color='FFFFC7CE', end_color='FFFFC7CE', fill_type='solid')
     
     # Title
     ws['A1'] = "DICOM Image Comparison Report"
-    ws['A1'].font = Font(name='Calibri', size=18, bold=True, color='2F5597')
+    ws['A1'].font = Font(name='Calibri', size=18, bold=True, color='FF2F5597')
     ws.merge_cells('A1:H1')
     
     # Summary information
@@ -322,11 +345,11 @@ def _create_image_summary_worksheet(ws, summary: ImageComparisonSummary) -> None
         ("Tolerance Used:", summary.tolerance_used),
         ("Normalization Applied:", "Yes" if summary.normalization_applied else "No"),
         ("Overall Similarity:", f"{summary.overall_similarity:.1%}"),
-        ("Generated:", pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S"))
+        ("Generated:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     ]
     
     for idx, (label, value) in enumerate(info_data, 4):
-        ws.cell(row=idx, column=1, value=label).font = Font(bold=True)
+        ws.cell(row=idx, column=1, value=label).font = label_font
         ws.cell(row=idx, column=2, value=value)
     
     # Results summary table
@@ -340,7 +363,7 @@ def _create_image_summary_worksheet(ws, summary: ImageComparisonSummary) -> None
         cell = ws.cell(row=13, column=col, value=header)
         cell.font = header_font
         cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center')
+        cell.alignment = header_alignment
     
     # Populate data
     for row_idx, result in enumerate(summary.file_results, 14):
@@ -352,7 +375,7 @@ def _create_image_summary_worksheet(ws, summary: ImageComparisonSummary) -> None
         extra = len(result.extra_instances)
         match_pct = (exact_matches / total_images * 100) if total_images > 0 else 0
         
-        ws.cell(row=row_idx, column=1, value=Path(result.comparison_file).name)
+        ws.cell(row=row_idx, column=1, value=result.comparison_name)
         ws.cell(row=row_idx, column=2, value=total_images)
         ws.cell(row=row_idx, column=3, value=exact_matches)
         ws.cell(row=row_idx, column=4, value=pixel_diffs)
@@ -363,11 +386,11 @@ def _create_image_summary_worksheet(ws, summary: ImageComparisonSummary) -> None
         # Color-code match percentage
         match_cell = ws.cell(row=row_idx, column=8, value=f"{match_pct:.1f}%")
         if match_pct >= 95:
-            match_cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+            match_cell.fill = good_fill
         elif match_pct >= 85:
-            match_cell.fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
+            match_cell.fill = fair_fill
         else:
-            match_cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+            match_cell.fill = poor_fill
     
     # Add charts
     chart_start_row = len(summary.file_results) + 16
@@ -379,6 +402,10 @@ def _create_image_summary_worksheet(ws, summary: ImageComparisonSummary) -> None
 
 def _add_image_similarity_chart(ws, summary: ImageComparisonSummary, start_row: int) -> None:
     """Add image similarity pie chart (safer version)"""
+    from openpyxl.chart import PieChart, Reference
+    from openpyxl.chart.series import DataPoint
+    from openpyxl.chart.shapes import GraphicalProperties
+
     try:
         chart = PieChart()
         chart.title = "Image Similarity Overview"
@@ -416,18 +443,13 @@ def _add_image_similarity_chart(ws, summary: ImageComparisonSummary, start_row:
             chart.add_data(data_ref, titles_from_data=False)
             chart.set_categories(labels_ref)
             
-            # Simplified color coding (skip if it causes issues)
-            try:
-                if chart.series and len(chart.series) > 0:
-                    series = chart.series[0]
-                    colors = ['00B050', 'FFC000', 'C5504B']  # Green, Orange, Red
-                    for i, color in enumerate(colors):
-                        if i < 3:  # Only first 3 data points
-                            point = DataPoint(idx=i)
-                            point.graphicalProperties.solidFill = color
-                            series.data_points.append(point)
-            except Exception as color_error:
-                console.print(f"⚠️  Chart coloring skipped: {color_error}", style="dim")
+            # Color the three slices: green, orange, red
+            if chart.series:
+                colors = ['00B050', 'FFC000', 'C5504B']
+                chart.series[0].data_points = [
+                    DataPoint(idx=i, spPr=GraphicalProperties(solidFill=color))
+                    for i, color in enumerate(colors)
+                ]
             
             ws.add_chart(chart, f"A{start_row + 5}")
             
@@ -440,6 +462,9 @@ def _add_image_similarity_chart(ws, summary: ImageComparisonSummary, start_row:
 
 def _add_image_difference_breakdown_chart(ws, summary: ImageComparisonSummary, start_row: int, start_col: int) -> None:
     """Add bar chart showing difference breakdown by file (fixed version)"""
+    from openpyxl.chart import BarChart, Reference
+    from openpyxl.utils import get_column_letter
+
     try:
         chart = BarChart()
         chart.title = "Image Differences by File"
@@ -454,7 +479,7 @@ def _add_image_difference_breakdown_chart(ws, summary: ImageComparisonSummary, s
         differences = []
         
         for result in summary.file_results:
-            file_names.append(Path(result.comparison_file).name[:15])  # Truncate long names
+            file_names.append(result.comparison_name[:15])  # Truncate long names
             exact_matches.append(result.exact_matches)
             differences.append(result.pixel_differences)
         
@@ -485,7 +510,7 @@ def _add_image_difference_breakdown_chart(ws, summary: ImageComparisonSummary, s
         chart.set_categories(categories_ref)
         
         # Add chart to worksheet
-        col_letter = openpyxl.utils.get_column_letter(start_col)
+        col_letter = get_column_letter(start_col)
         ws.add_chart(chart, f"{col_letter}{start_row + 4}")
         
     except Exception as e:
@@ -494,59 +519,87 @@ def _add_image_difference_breakdown_chart(ws, summary: ImageComparisonSummary, s
 
 def _create_image_comparison_worksheet(ws, summary: ImageComparisonSummary) -> None:
     """Create detailed image comparison worksheet"""
+    from openpyxl.styles import Font, PatternFill, Alignment
+
     ws.title = "Detailed Comparisons"
     
     # Headers
     headers = ["Baseline File", "Comparison File", "SOP Instance UID", "Exact Match", 
               "Similarity Score", "Pixel Differences", "Max Difference", "Mean Difference",
-              "RMSE", "Baseline Shape", "Comparison Shape", "Difference Type", "Tolerance Used"]
+              "RMSE", "Baseline Shape", "Comparison Shape", "Difference Type", "Tolerance Used",
+              "Approximate"]
     
     # Add headers with formatting
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = Font(bold=True, color='FFFFFF')
-        cell.fill = PatternFill(start_color='2F5597', end_color='2F5597', fill_type='solid')
-        cell.alignment = Alignment(horizontal='center')
-    
-    # Add data
+    header_font = Font(bold=True, color='FFFFFFFF')
+    header_fill = PatternFill(start_color='FF2F5597', end_color='FF2F5597', fill_type='solid')
+    header_alignment = Alignment(horizontal='center')
+    ws.append(headers)
+    for cell in ws[1]:
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_alignment
+    
+    # Add data a row at a time; only the Exact Match cell needs styling afterwards
+    exact_fill = PatternFill(start_color='FFC6EFCE', end_color='FFC6EFCE', fill_type='solid')
+    diff_fill = PatternFill(start_color='FFFFC7CE', end_color='FFFFC7CE', fill_type='solid')
+    # Column widths are measured while appending (bold headers get +4, as in
+    # _auto_adjust_column_widths) so this, the largest sheet, is not rescanned
+    column_widths = {column: len(header) + 4 for column, header in enumerate(headers, 1)}
     row_idx = 2
     for result in summary.file_results:
+        baseline_name = result.baseline_name
+        comparison_name = result.comparison_name
+        
         for img_comp in result.image_comparisons:
-            ws.cell(row=row_idx, column=1, value=Path(result.baseline_file).name)
-            ws.cell(row=row_idx, column=2, value=Path(result.comparison_file).name)
-            ws.cell(row=row_idx, column=3, value=img_comp.sop_instance_uid)
+            # Resolve per-row attribute chains once
+            baseline_stats = img_comp.baseline_stats
+            comparison_stats = img_comp.comparison_stats
+            is_exact_match = img_comp.is_exact_match
+            
+            row = (
+                baseline_name,
+                comparison_name,
+                img_comp.sop_instance_uid,
+                is_exact_match,
+                f"{img_comp.similarity_score:.4f}",
+                img_comp.pixel_differences,
+                img_comp.max_difference,
+                img_comp.mean_difference,
+                img_comp.rmse,
+                str(baseline_stats.shape) if baseline_stats else "N/A",
+                str(comparison_stats.shape) if comparison_stats else "N/A",
+                img_comp.difference_type.value,
+                img_comp.tolerance_used,
+                img_comp.is_approximate
+            )
+            ws.append(row)
             
             # Color-code exact match
-            exact_match_cell = ws.cell(row=row_idx, column=4, value=img_comp.is_exact_match)
-            if img_comp.is_exact_match:
-                exact_match_cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-            else:
-                exact_match_cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+            ws.cell(row=row_idx, column=4).fill = exact_fill if is_exact_match else diff_fill
             
-            ws.cell(row=row_idx, column=5, value=f"{img_comp.similarity_score:.4f}")
-            ws.cell(row=row_idx, column=6, value=img_comp.pixel_differences)
-            ws.cell(row=row_idx, column=7, value=img_comp.max_difference)
-            ws.cell(row=row_idx, column=8, value=img_comp.mean_difference)
-            ws.cell(row=row_idx, column=9, value=img_comp.rmse)
-            ws.cell(row=row_idx, column=10, value=str(img_comp.baseline_stats.shape) if img_comp.baseline_stats else "N/A")
-            ws.cell(row=row_idx, column=11, value=str(img_comp.comparison_stats.shape) if img_comp.comparison_stats else "N/A")
-            ws.cell(row=row_idx, column=12, value=img_comp.difference_type.value)
-            ws.cell(row=row_idx, column=13, value=img_comp.tolerance_used)
+            for column, value in enumerate(row, 1):
+                if value is not None:
+                    length = len(str(value))
+                    if length > column_widths[column]:
+                        column_widths[column] = length
             
             row_idx += 1
     
-    # Auto-adjust columns
-    _auto_adjust_column_widths(ws)
+    # Size columns from the measured widths
+    _set_column_widths(ws, column_widths)
 
 def _create_image_statistics_worksheet(ws, summary: ImageComparisonSummary) -> None:
     """Create image statistics worksheet"""
+    from openpyxl.styles import Font
+    import numpy as np
+
     ws.title = "Statistics"
     
-    subheader_font = Font(name='Calibri', size=12, bold=True, color='2F5597')
+    subheader_font = Font(name='Calibri', size=12, bold=True, color='FF2F5597')
     
     # Overall statistics
     ws['A1'] = "Image Comparison Statistics"
-    ws['A1'].font = Font(name='Calibri', size=16, bold=True, color='2F5597')
+    ws['A1'].font = Font(name='Calibri', size=16, bold=True, color='FF2F5597')
     
     ws['A3'] = "Overall Results"
     ws['A3'].font = subheader_font
@@ -581,8 +634,9 @@ def _create_image_statistics_worksheet(ws, summary: ImageComparisonSummary) -> N
         ("Average Pixel Difference:", f"{np.mean(all_mean_diffs):.2f}" if all_mean_diffs else "N/A"),
     ]
     
+    label_font = Font(bold=True)
     for idx, (label, value) in enumerate(stats_data, 4):
-        ws.cell(row=idx, column=1, value=label).font = Font(bold=True)
+        ws.cell(row=idx, column=1, value=label).font = label_font
         ws.cell(row=idx, column=2, value=value)
     
     # Per-file breakdown
@@ -592,7 +646,7 @@ def _create_image_statistics_worksheet(ws, summary: ImageComparisonSummary) -> N
     file_headers = ["File", "Images", "Exact Matches", "Differences", "Match %", "Avg Similarity"]
     for col, header in enumerate(file_headers, 1):
         cell = ws.cell(row=15, column=col, value=header)
-        cell.font = Font(bold=True)
+        cell.font = label_font
     
     for row_idx, result in enumerate(summary.file_results, 16):
         total_images = len(result.image_comparisons)
@@ -601,7 +655,7 @@ def _create_image_statistics_worksheet(ws, summary: ImageComparisonSummary) -> N
         match_pct = (exact_matches / total_images * 100) if total_images > 0 else 0
         avg_similarity = result.average_similarity
         
-        ws.cell(row=row_idx, column=1, value=Path(result.comparison_file).name)
+        ws.cell(row=row_idx, column=1, value=result.comparison_name)
         ws.cell(row=row_idx, column=2, value=total_images)
         ws.cell(row=row_idx, column=3, value=exact_matches)
         ws.cell(row=row_idx, column=4, value=differences)
@@ -612,33 +666,38 @@ def _create_image_statistics_worksheet(ws, summary: ImageComparisonSummary) -> N
 
 def _create_image_settings_worksheet(ws, summary: ImageComparisonSummary) -> None:
     """Create settings and information worksheet"""
+    from openpyxl.styles import Font
+    from datetime import datetime
+
     ws.title = "Settings & Info"
     
-    subheader_font = Font(name='Calibri', size=12, bold=True, color='2F5597')
+    subheader_font = Font(name='Calibri', size=12, bold=True, color='FF2F5597')
+    label_font = Font(bold=True)
     
     # Settings used
     ws['A1'] = "Comparison Settings"
-    ws['A1'].font = Font(name='Calibri', size=16, bold=True, color='2F5597')
+    ws['A1'].font = Font(name='Calibri', size=16, bold=True, color='FF2F5597')
     
     settings_data = [
         ("Tolerance Used:", summary.tolerance_used),
+        ("Tolerance Units:", summary.tolerance_units),
         ("Normalization Applied:", "Yes" if summary.normalization_applied else "No"),
         ("Comparison Mode:", "Image Pixel Data"),
-        ("Report Generated:", pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S")),
+        ("Report Generated:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
     ]
     
     for idx, (label, value) in enumerate(settings_data, 3):
-        ws.cell(row=idx, column=1, value=label).font = Font(bold=True)
+        ws.cell(row=idx, column=1, value=label).font = label_font
         ws.cell(row=idx, column=2, value=value)
     
     # File information
     ws['A8'] = "File Information"
     ws['A8'].font = subheader_font
     
-    ws.cell(row=9, column=1, value="Baseline File:").font = Font(bold=True)
+    ws.cell(row=9, column=1, value="Baseline File:").font = label_font
     ws.cell(row=9, column=2, value=Path(summary.baseline_file).name)
     
-    ws.cell(row=11, column=1, value="Comparison Files:").font = Font(bold=True)
+    ws.cell(row=11, column=1, value="Comparison Files:").font = label_font
     for idx, comp_file in enumerate(summary.comparison_files, 12):
         ws.cell(row=idx, column=2, value=Path(comp_file).name)
     
@@ -649,55 +708,62 @@ def _create_image_settings_worksheet(ws, summary: ImageComparisonSummary) -> Non
     explanations = [
         ("Similarity Score:", "Percentage of pixels that match (0.0 to 1.0)"),
         ("RMSE:", "Root Mean Square Error - lower values indicate more similar images"),
-        ("Max Difference:", "Largest pixel value difference found between images"),
-        ("Mean Difference:", "Average pixel value difference across all pixels"),
-        ("Tolerance:", "Maximum allowed pixel difference to be considered a match"),
-        ("Normalization:", "Applies DICOM rescale slope/intercept and windowing"),
+        ("Max Difference:", "Largest pixel value difference found between images, in the tolerance units"),
+        ("Mean Difference:", "Average pixel value difference across all pixels, in the tolerance units"),
+        ("Tolerance:", "Maximum allowed pixel difference to be considered a match, in the tolerance units"),
+        ("Tolerance Units:", "0-255 display levels when both images carry a VOI window, else modality values"),
+        ("Normalization:", "Applies DICOM rescale slope/intercept, then the VOI window when both images have one"),
+        ("Approximate:", "Statistics estimated from a --quick-reject pixel subsample"),
     ]
     
     start_row = 17 + len(summary.comparison_files)
     for idx, (term, explanation) in enumerate(explanations):
-        ws.cell(row=start_row + idx, column=1, value=term).font = Font(bold=True)
+        ws.cell(row=start_row + idx, column=1, value=term).font = label_font
         ws.cell(row=start_row + idx, column=2, value=explanation)
     
     _auto_adjust_column_widths(ws)
 
 def _auto_adjust_column_widths(ws, min_width: int = 10, max_width: int = 50) -> None:
     """Auto-adjust column widths based on content (fixed for merged cells)"""
+    # Widths are tracked by column number; letters are only needed for the final assignment
     column_widths = {}
     
     # Iterate through all rows and columns safely
     for row in ws.iter_rows():
         for cell in row:
-            # Skip merged cells
-            if hasattr(cell, 'coordinate') and cell.coordinate in ws.merged_cells:
+            if cell.value is None:
+                continue
+            
+            # Skip merged cells (checked only for cells holding a value)
+            if cell.coordinate in ws.merged_cells:
                 continue
             
-            if cell.value is not None:
-                # Get column letter safely
-                try:
-                    column_letter = cell.column_letter
-                except AttributeError:
-                    # Handle merged cells or other edge cases
-                    continue
-                
-                # Calculate content length
-                cell_value = str(cell.value)
-                content_length = len(cell_value)
-                
-                # Add extra space for headers and bold text
-                if cell.font and cell.font.bold:
-                    content_length += 4
-                elif cell.font and cell.font.size and cell.font.size > 12:
-                    content_length += 2
-                
-                # Track the maximum width needed for this column
-                if column_letter not in column_widths:
-                    column_widths[column_letter] = content_length
-                else:
-                    column_widths[column_letter] = max(column_widths[column_letter], content_length)
+            # Calculate content length
+            cell_value = str(cell.value)
+            content_length = len(cell_value)
+            
+            # Add extra space for headers and bold text (cell.font resolves the
+            # style array on every access, so read it once)
+            font = cell.font
+            if font and font.bold:
+                content_length += 4
+            elif font and font.size and font.size > 12:
+                content_length += 2
+            
+            # Track the maximum width needed for this column
+            column = cell.column
+            if column not in column_widths:
+                column_widths[column] = content_length
+            else:
+                column_widths[column] = max(column_widths[column], content_length)
     
     # Apply the calculated widths
-    for column_letter, width in column_widths.items():
+    _set_column_widths(ws, column_widths, min_width, max_width)
+
+def _set_column_widths(ws, column_widths: dict, min_width: int = 10, max_width: int = 50) -> None:
+    """Set column widths from the longest content length per column number"""
+    from openpyxl.utils import get_column_letter
+
+    for column, width in column_widths.items():
         final_width = max(min_width, min(width + 2, max_width))
-        ws.column_dimensions[column_letter].width = final_width
\ No newline at end of file
+        ws.column_dimensions[get_column_letter(column)].width = final_width
\ No newline at end of file
@@ -1,8 +1,16 @@
 """DICOM image pixel data comparison"""
 
+import ctypes
+import math
+import mmap
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 import numpy as np
 import pydicom
-from typing import Dict, List, Optional, Tuple
+from pydicom.multival import MultiValue
+from typing import Callable, Dict, List, Optional, Tuple
 from rich.console import Console
 
 from .models import DicomInstance
@@ -11,31 +19,369 @@ from .image_models import (
     ImageDifferenceType, ImageComparisonSummary
 )
 from .dicom_loader import DicomStudy
+from .kernels import HAS_NUMBA, diff_reduce, min_max_mean
+from .utils import worker_context
 
 console = Console()
 
+# libc memcmp for bitwise buffer equality (not resolvable this way on Windows)
+try:
+    _memcmp = ctypes.CDLL(None).memcmp
+    _memcmp.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+    _memcmp.restype = ctypes.c_int
+except (OSError, TypeError, AttributeError):
+    _memcmp = None
+
+# Header attributes needed to locate, decode and normalize pixel data
+PIXEL_HEADER_TAGS = [
+    'Rows', 'Columns', 'NumberOfFrames', 'SamplesPerPixel', 'BitsAllocated',
+    'BitsStored', 'PixelRepresentation', 'PhotometricInterpretation',
+    'RescaleSlope', 'RescaleIntercept', 'WindowCenter', 'WindowWidth', 'VOILUTFunction',
+]
+
+# Everything a pydicom pixel decoder reads, for the full (compressed) fallback read
+PIXEL_DECODE_TAGS = PIXEL_HEADER_TAGS + [
+    'PlanarConfiguration', 'ExtendedOffsetTable', 'ExtendedOffsetTableLengths',
+    'PixelData', 'FloatPixelData', 'DoubleFloatPixelData',
+]
+
+# Transfer syntaxes whose pixel data can be read straight into an array
+NATIVE_TRANSFER_SYNTAXES = {
+    pydicom.uid.ImplicitVRLittleEndian,
+    pydicom.uid.ExplicitVRLittleEndian,
+}
+
+# (7FE0,0010) Pixel Data tag as encoded in little-endian files
+PIXEL_DATA_TAG_BYTES = b'\xe0\x7f\x10\x00'
+
+# Decoding plugins for compressed pixel data, fastest first
+PREFERRED_DECODING_PLUGINS = ('pylibjpeg', 'gdcm', 'pillow')
+
+# Uncompressed pixel data at least this large is memory-mapped rather than read
+MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Output range of the VOI LUT applied during normalization (8-bit display levels)
+VOI_OUTPUT_MIN = 0.0
+VOI_OUTPUT_MAX = 255.0
+
+# Default memory budget for decoded pixel arrays kept between comparisons
+DEFAULT_PIXEL_CACHE_BYTES = 2 * 1024 ** 3
+
+# Below this many matched images a process pool costs more than it saves
+PARALLEL_MIN_IMAGES = 32
+
+def _prefer_fast_v2_handlers() -> None:
+    """On pydicom 2.x, order the pixel data handlers fastest first"""
+    handlers = getattr(pydicom.config, 'pixel_data_handlers', None)
+    if handlers is None or int(pydicom.__version__.split('.')[0]) >= 3:
+        return
+    
+    order = {f"{name}_handler": idx for idx, name in enumerate(PREFERRED_DECODING_PLUGINS)}
+    order['numpy_handler'] = 0  # Uncompressed data always goes through NumPy
+    handlers.sort(key=lambda handler: order.get(handler.__name__.rsplit('.', 1)[-1], len(order)))
+
+
+_prefer_fast_v2_handlers()
+
+
+def _select_decoding_plugin(transfer_syntax, preferred: Tuple[str, ...]) -> Optional[str]:
+    """Pick the first preferred plugin that can decode this transfer syntax (pydicom 3+)"""
+    try:
+        from pydicom.pixels import get_decoder
+        available = get_decoder(transfer_syntax).available_plugins
+    except (ImportError, NotImplementedError, ValueError):
+        return None
+    
+    for name in preferred:
+        if name in available:
+            return name
+    return None
+
+
+# Subsampled difference must exceed tolerance by this factor to skip the full pass
+QUICK_REJECT_MARGIN = 2.0
+
+# Matched pairs handed to a pool worker at a time (every comparison of one
+# baseline image stays in the same chunk, so a chunk may run slightly over)
+POOL_CHUNK_SIZE = 8
+
+# Same-shaped images are stacked and reduced together up to this many bytes
+BATCH_MAX_BYTES = 64 * 1024 * 1024
+
+# Large volumes are differenced this many pixels at a time so the scratch
+# buffer stays bounded and memory-mapped inputs are read through sequentially
+DIFF_CHUNK_PIXELS = 4 * 1024 * 1024
+
+# Per-process comparator used by pool workers (set by _init_worker)
+_worker_comparator = None
+
+
+def _init_worker(tolerance: float, normalize: bool, cache_budget_bytes: int,
+                 decoding_plugin: Optional[str], quick_reject: bool, quick_factor: int) -> None:
+    """Build the comparator each pool worker reuses for all of its tasks"""
+    global _worker_comparator
+    _worker_comparator = ImageComparator(
+        tolerance=tolerance, normalize=normalize,
+        cache_budget_bytes=cache_budget_bytes, decoding_plugin=decoding_plugin,
+        quick_reject=quick_reject, quick_factor=quick_factor
+    )
+
+
+def _compare_chunk(tasks: List[Tuple[DicomInstance, DicomInstance, str, str]]) -> List[ImageComparisonResult]:
+    """Pool entry point: compare a chunk of matched instance pairs"""
+    return _worker_comparator._compare_pairs(tasks)
+
+
+def _diff_stats(a: np.ndarray, b: np.ndarray, tol: float,
+                scratch: Optional[Callable] = None) -> Tuple[float, float, float, int]:
+    """
+    Compute absolute-difference statistics in one fused Numba pass, or
+    chunk by chunk through a bounded scratch buffer when Numba is unavailable
+
+    Args:
+        a: Baseline pixel array
+        b: Comparison pixel array (same shape as a)
+        tol: Tolerance above which a pixel counts as different
+        scratch: Optional (shape, dtype) -> ndarray provider for the difference buffer
+
+    Returns:
+        Tuple of (max_diff, sum_diff, sum_sq_diff, different_pixels)
+    """
+    if HAS_NUMBA:
+        max_diff, sum_diff, sum_sq, different = diff_reduce(a.ravel(), b.ravel(), tol)
+        return float(max_diff), float(sum_diff), float(sum_sq), int(different)
+
+    # float32 holds 8/16-bit integer pixels exactly; wider inputs keep float64
+    buf_dtype = np.result_type(a.dtype, b.dtype, np.float32)
+    a_flat, b_flat = a.reshape(-1), b.reshape(-1)
+    chunk = min(a_flat.size, DIFF_CHUNK_PIXELS)
+    buf = scratch((chunk,), buf_dtype) if scratch else np.empty(chunk, dtype=buf_dtype)
+
+    max_diff = sum_diff = sum_sq = 0.0
+    different = 0
+    for start in range(0, a_flat.size, chunk):
+        stop = min(start + chunk, a_flat.size)
+        part = buf[:stop - start]
+        np.subtract(a_flat[start:stop], b_flat[start:stop], out=part, dtype=buf_dtype)
+        np.abs(part, out=part)
+
+        max_diff = max(max_diff, float(part.max()))
+        sum_diff += float(part.sum(dtype=np.float64))
+        sum_sq += float(np.dot(part, part))
+        # Absolute differences are non-negative, so at zero tolerance any nonzero counts
+        different += int(np.count_nonzero(part if tol == 0 else part > tol))
+
+    return max_diff, sum_diff, sum_sq, different
+
+
+def _diff_stats_batch(a: np.ndarray, b: np.ndarray, tol: float, scratch: Optional[Callable] = None):
+    """
+    Row-wise absolute-difference statistics for stacked (K, N) pixel blocks
+
+    Returns:
+        Tuple of per-row arrays (max_diff, sum_diff, sum_sq_diff, different_pixels)
+    """
+    buf_dtype = np.result_type(a.dtype, b.dtype, np.float32)
+    buf = scratch(a.shape, buf_dtype) if scratch else np.empty(a.shape, dtype=buf_dtype)
+    np.subtract(a, b, out=buf, dtype=buf_dtype)
+    np.abs(buf, out=buf)
+
+    max_diff = buf.max(axis=1)
+    sum_diff = buf.sum(axis=1, dtype=np.float64)
+    # One row-wise reduction, accumulated in float64 like sum_diff
+    sum_sq = np.einsum('ij,ij->i', buf, buf, dtype=np.float64)
+    different = np.count_nonzero(buf if tol == 0 else buf > tol, axis=1)
+
+    return max_diff, sum_diff, sum_sq, different
+
+
+def _bitwise_equal(a: np.ndarray, b: np.ndarray) -> bool:
+    """Compare two same-shaped arrays byte for byte without allocating a boolean temp"""
+    if a.dtype != b.dtype or a.shape != b.shape:
+        return False
+    if _memcmp is None:
+        return bool(np.array_equal(a, b))
+    a = np.ascontiguousarray(a)
+    b = np.ascontiguousarray(b)
+    return _memcmp(a.ctypes.data, b.ctypes.data, a.nbytes) == 0
+
+
+def _has_stray_high_bits(pixel_array: np.ndarray, bits_stored: int, signed: bool) -> bool:
+    """
+    Check whether any pixel falls outside the BitsStored range, i.e. masking would change it
+
+    The array is scanned DIFF_CHUNK_PIXELS at a time with min/max reductions, which
+    allocate nothing and read memory-mapped data through once.
+    """
+    if signed:
+        low, high = -(1 << (bits_stored - 1)), (1 << (bits_stored - 1)) - 1
+    else:
+        low, high = 0, (1 << bits_stored) - 1
+
+    flat = pixel_array.reshape(-1)
+    for start in range(0, flat.size, DIFF_CHUNK_PIXELS):
+        part = flat[start:start + DIFF_CHUNK_PIXELS]
+        if part.min() < low or part.max() > high:
+            return True
+    return False
+
+
+def _first_value(value) -> float:
+    """First item of a possibly multi-valued numeric DICOM attribute"""
+    if isinstance(value, (list, tuple, MultiValue)):
+        value = value[0]
+    return float(value)
+
+
+def _has_voi_window(dicom_instance: DicomInstance) -> bool:
+    """Whether the instance header carries a VOI LUT window (center and width)"""
+    tags = dicom_instance.tags
+    return tags.get('WindowCenter') is not None and tags.get('WindowWidth') is not None
+
+
+def _apply_voi_lut(buf: np.ndarray, center: float, width: float, function: str = 'LINEAR',
+                   y_min: float = VOI_OUTPUT_MIN, y_max: float = VOI_OUTPUT_MAX) -> np.ndarray:
+    """
+    Apply a DICOM VOI LUT function (PS3.3 C.11.2.1.2) in place on a float buffer
+
+    Args:
+        buf: Float array of modality values, overwritten with output values
+        center: Window Center
+        width: Window Width
+        function: VOI LUT Function (LINEAR, LINEAR_EXACT or SIGMOID)
+        y_min: Minimum output value
+        y_max: Maximum output value
+
+    Returns:
+        The windowed buffer
+    """
+    y_range = y_max - y_min
+    dtype = buf.dtype.type
+
+    if function == 'SIGMOID':
+        if width <= 0:
+            raise ValueError(f"Invalid window width for SIGMOID: {width}")
+        # y = y_range / (1 + exp(-4 * (x - c) / w)) + y_min
+        np.subtract(buf, dtype(center), out=buf)
+        np.multiply(buf, dtype(-4.0 / width), out=buf)
+        np.exp(buf, out=buf)
+        np.add(buf, dtype(1.0), out=buf)
+        np.divide(dtype(y_range), buf, out=buf)
+        np.add(buf, dtype(y_min), out=buf)
+        return buf
+
+    if function == 'LINEAR_EXACT':
+        if width <= 0:
+            raise ValueError(f"Invalid window width for LINEAR_EXACT: {width}")
+        # y = ((x - c) / w + 0.5) * y_range + y_min
+        np.subtract(buf, dtype(center), out=buf)
+        np.multiply(buf, dtype(1.0 / width), out=buf)
+    else:
+        if width < 1:
+            raise ValueError(f"Invalid window width for LINEAR: {width}")
+        if width == 1:
+            # Degenerate window is a threshold at c - 0.5
+            np.copyto(buf, np.where(buf <= center - 0.5, dtype(y_min), dtype(y_max)))
+            return buf
+        # y = ((x - (c - 0.5)) / (w - 1) + 0.5) * y_range + y_min
+        np.subtract(buf, dtype(center - 0.5), out=buf)
+        np.multiply(buf, dtype(1.0 / (width - 1)), out=buf)
+
+    np.add(buf, dtype(0.5), out=buf)
+    np.multiply(buf, dtype(y_range), out=buf)
+    np.add(buf, dtype(y_min), out=buf)
+    np.clip(buf, dtype(y_min), dtype(y_max), out=buf)
+    return buf
+
+
 class ImageProcessor:
     """Handle DICOM image extraction and preprocessing"""
     
-    def __init__(self, normalize: bool = True):
+    def __init__(self, normalize: bool = True, cache_budget_bytes: int = DEFAULT_PIXEL_CACHE_BYTES,
+                 decoding_plugin: Optional[str] = None):
         self.normalize = normalize
+        self.cache_budget_bytes = cache_budget_bytes
+        self.decoding_plugin = decoding_plugin
+        self._decoding_plugins = (
+            ((decoding_plugin,) if decoding_plugin else ()) + PREFERRED_DECODING_PLUGINS
+        )
+        self._plugin_by_syntax: Dict[str, Optional[str]] = {}
+        
+        # LRU of decoded (and normalized) arrays keyed by (file_path, mtime_ns, apply_voi).
+        # Per process: compare_study_sets keeps every comparison of a baseline image
+        # in one task, so it is decoded once in whichever process runs that task
+        self._pixel_cache: "OrderedDict[Tuple[str, int, bool], np.ndarray]" = OrderedDict()
+        self._pixel_cache_bytes = 0
     
-    def extract_pixel_data(self, dicom_instance: DicomInstance) -> Optional[np.ndarray]:
-        """Extract pixel data from DICOM instance"""
+    def extract_pixel_data(self, dicom_instance: DicomInstance, apply_voi: bool = True) -> Optional[np.ndarray]:
+        """
+        Extract pixel data from DICOM instance, reusing previously decoded arrays
+        
+        Args:
+            dicom_instance: Instance to read
+            apply_voi: When normalizing, also apply the VOI LUT window (0-255 display
+                levels); otherwise stop at modality values
+        """
         try:
-            # Load the DICOM file
-            ds = pydicom.dcmread(dicom_instance.file_path)
-            
-            # Check if pixel data exists
-            if not hasattr(ds, 'PixelData') or ds.PixelData is None:
-                return None
+            path = str(dicom_instance.file_path)
+            cache_key = (path, os.stat(path).st_mtime_ns, apply_voi)
+        except OSError:
+            cache_key = None
+        
+        if cache_key is not None and cache_key in self._pixel_cache:
+            self._pixel_cache.move_to_end(cache_key)
+            return self._pixel_cache[cache_key]
+        
+        pixel_array = self._read_pixel_data(dicom_instance, apply_voi)
+        
+        if cache_key is not None and pixel_array is not None:
+            self._cache_pixel_array(cache_key, pixel_array)
+        
+        return pixel_array
+    
+    def _cache_pixel_array(self, cache_key: Tuple[str, int, bool], pixel_array: np.ndarray) -> None:
+        """Store an array in the LRU cache, evicting oldest entries past the byte budget"""
+        if pixel_array.nbytes > self.cache_budget_bytes:
+            return
+        
+        # Cached arrays are shared between comparisons, so guard against mutation
+        pixel_array.flags.writeable = False
+        self._pixel_cache[cache_key] = pixel_array
+        self._pixel_cache_bytes += pixel_array.nbytes
+        
+        while self._pixel_cache_bytes > self.cache_budget_bytes:
+            _, evicted = self._pixel_cache.popitem(last=False)
+            self._pixel_cache_bytes -= evicted.nbytes
+    
+    def _read_pixel_data(self, dicom_instance: DicomInstance, apply_voi: bool = True) -> Optional[np.ndarray]:
+        """Read and decode pixel data from disk"""
+        try:
+            # Parse only the header attributes we need, stopping at Pixel Data
+            with open(dicom_instance.file_path, 'rb') as f:
+                ds = pydicom.dcmread(f, stop_before_pixels=True, specific_tags=PIXEL_HEADER_TAGS)
+                
+                # Reached end of file without a pixel data element
+                if not f.read(1):
+                    return None
+                f.seek(-1, os.SEEK_CUR)
+                
+                pixel_array = self._read_native_pixels(f, ds)
             
-            # Get pixel array
-            pixel_array = ds.pixel_array
+            if pixel_array is None:
+                # Compressed or unusual layout - let pydicom decode it, skipping
+                # private and other attributes the decoder never looks at
+                ds = pydicom.dcmread(dicom_instance.file_path, specific_tags=PIXEL_DECODE_TAGS)
+                
+                # Check if pixel data exists
+                if not hasattr(ds, 'PixelData') or ds.PixelData is None:
+                    return None
+                
+                self._prefer_decoding_plugin(ds)
+                pixel_array = ds.pixel_array
             
             # Apply DICOM transformations if requested
             if self.normalize:
-                pixel_array = self._normalize_image(pixel_array, ds)
+                pixel_array = self._normalize_image(pixel_array, ds, apply_voi)
             
             return pixel_array
             
@@ -43,26 +389,145 @@ class ImageProcessor:
             console.print(f"⚠️  Failed to extract pixel data from {dicom_instance.sop_instance_uid}: {e}", style="yellow")
             return None
     
-    def _normalize_image(self, pixel_array: np.ndarray, ds: pydicom.Dataset) -> np.ndarray:
-        """Apply DICOM normalization (rescale slope/intercept, window/level)"""
+    def _prefer_decoding_plugin(self, ds: pydicom.Dataset) -> None:
+        """Route compressed pixel data through the fastest installed decoder"""
+        transfer_syntax = getattr(getattr(ds, 'file_meta', None), 'TransferSyntaxUID', None)
+        if transfer_syntax is None or not transfer_syntax.is_compressed:
+            return
+        
+        if transfer_syntax not in self._plugin_by_syntax:
+            self._plugin_by_syntax[transfer_syntax] = _select_decoding_plugin(
+                transfer_syntax, self._decoding_plugins
+            )
+        
+        plugin = self._plugin_by_syntax[transfer_syntax]
+        if plugin and hasattr(ds, 'pixel_array_options'):
+            ds.pixel_array_options(decoding_plugin=plugin)
+    
+    def _read_native_pixels(self, f, ds: pydicom.Dataset) -> Optional[np.ndarray]:
+        """
+        Read uncompressed little-endian monochrome pixel data straight from the file
+        
+        Args:
+            f: File object positioned at the Pixel Data element
+            ds: Header dataset read with stop_before_pixels
+            
+        Returns:
+            Pixel array shaped like ds.pixel_array, or None if the fast path doesn't apply
+        """
+        transfer_syntax = getattr(getattr(ds, 'file_meta', None), 'TransferSyntaxUID', None)
+        if transfer_syntax not in NATIVE_TRANSFER_SYNTAXES:
+            return None
+        
+        bits_allocated = ds.get('BitsAllocated')
+        if (ds.get('SamplesPerPixel', 1) != 1 or bits_allocated not in (8, 16, 32)
+                or ds.get('PixelRepresentation') not in (0, 1)):
+            return None
+        
+        rows, columns = ds.get('Rows'), ds.get('Columns')
+        if not rows or not columns:
+            return None
+        frames = int(ds.get('NumberOfFrames') or 1)
+        
+        # Pixel Data element header: tag, then (explicit VR) VR + reserved + 4-byte length,
+        # or (implicit VR) a 4-byte length
+        if f.read(4) != PIXEL_DATA_TAG_BYTES:
+            return None
+        if transfer_syntax == pydicom.uid.ExplicitVRLittleEndian:
+            if f.read(2) not in (b'OB', b'OW'):
+                return None
+            f.read(2)
+        length = int.from_bytes(f.read(4), 'little')
+        
+        expected_length = rows * columns * frames * bits_allocated // 8
+        if length == 0xFFFFFFFF or length < expected_length:
+            return None
+        
+        signed = ds.PixelRepresentation == 1
+        dtype = np.dtype(f"<{'i' if signed else 'u'}{bits_allocated // 8}")
+        
+        if expected_length >= MMAP_THRESHOLD_BYTES:
+            # Large volumes: map the file and let the OS page pixels in as they're used
+            pixel_offset = f.tell()
+            if os.fstat(f.fileno()).st_size < pixel_offset + expected_length:
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            pixel_array = np.frombuffer(
+                mapped, dtype=dtype, count=expected_length // dtype.itemsize, offset=pixel_offset
+            )
+        else:
+            pixel_array = np.frombuffer(f.read(expected_length), dtype=dtype)
+            if pixel_array.size * dtype.itemsize != expected_length:
+                return None
+        
+        shape = (rows, columns) if frames == 1 else (frames, rows, columns)
+        pixel_array = pixel_array.reshape(shape)
+        
+        # Ignore unused high bits the same way pydicom does. Masking copies the whole
+        # array (and defeats the memory map), so only do it when a value actually has
+        # bits set above BitsStored - normally they are all zero
+        bits_stored = ds.get('BitsStored') or bits_allocated
+        if bits_stored < bits_allocated and _has_stray_high_bits(pixel_array, bits_stored, signed):
+            shift = bits_allocated - bits_stored
+            pixel_array = np.left_shift(pixel_array, shift)
+            np.right_shift(pixel_array, shift, out=pixel_array)
+        
+        return pixel_array
+    
+    def _normalize_image(self, pixel_array: np.ndarray, ds: pydicom.Dataset, apply_voi: bool = True) -> np.ndarray:
+        """Apply DICOM normalization (rescale slope/intercept, then window/level if apply_voi)"""
+        
+        # Read the VOI LUT window/level first: when one applies, the rescale can go
+        # straight into the float32 buffer that gets windowed, so a large (possibly
+        # memory-mapped) image is copied once rather than twice
+        window = None
+        if apply_voi and hasattr(ds, 'WindowCenter') and hasattr(ds, 'WindowWidth'):
+            try:
+                window = (
+                    _first_value(ds.WindowCenter), _first_value(ds.WindowWidth),
+                    str(ds.get('VOILUTFunction', 'LINEAR') or 'LINEAR').upper()
+                )
+            except (ValueError, TypeError):
+                # Skip windowing if values are invalid
+                pass
         
-        # Apply rescale slope and intercept
+        # Apply rescale slope and intercept, promoting at most to float32
+        owned = False
         if hasattr(ds, 'RescaleSlope') and hasattr(ds, 'RescaleIntercept'):
             slope = float(ds.RescaleSlope)
             intercept = float(ds.RescaleIntercept)
-            pixel_array = pixel_array * slope + intercept
+            
+            if (window is None and pixel_array.dtype.kind in 'iu'
+                    and slope == 1.0 and intercept.is_integer()):
+                # Pure integer offset - stay integer, widened so the offset can't overflow
+                if intercept != 0.0:
+                    pixel_array = np.add(
+                        pixel_array, int(intercept),
+                        dtype=np.result_type(pixel_array.dtype, np.int32)
+                    )
+                    owned = True
+            else:
+                buf = pixel_array.astype(np.float32)
+                if slope != 1.0:
+                    np.multiply(buf, np.float32(slope), out=buf)
+                if intercept != 0.0:
+                    np.add(buf, np.float32(intercept), out=buf)
+                pixel_array = buf
+                owned = True
         
-        # Apply window/level if present (simplified for now)
-        if hasattr(ds, 'WindowCenter') and hasattr(ds, 'WindowWidth'):
+        # Apply the VOI LUT window/level if present
+        if window is not None:
+            center, width, voi_function = window
+            
+            # Window in place on a float32 buffer we own
+            if not owned or pixel_array.dtype.kind != 'f':
+                pixel_array = pixel_array.astype(np.float32)
             try:
-                center = float(ds.WindowCenter) if not isinstance(ds.WindowCenter, list) else float(ds.WindowCenter[0])
-                width = float(ds.WindowWidth) if not isinstance(ds.WindowWidth, list) else float(ds.WindowWidth[0])
-                
-                min_val = center - width / 2
-                max_val = center + width / 2
-                pixel_array = np.clip(pixel_array, min_val, max_val)
-            except (ValueError, TypeError):
-                # Skip windowing if values are invalid
+                pixel_array = _apply_voi_lut(pixel_array, center, width, voi_function)
+            except ValueError:
+                # Skip windowing if the width is invalid for the function
                 pass
         
         return pixel_array
@@ -75,29 +540,42 @@ class ImageProcessor:
                 mean_value=0, has_pixel_data=False
             )
         
-        stats = ImageStats(
+        if HAS_NUMBA and pixel_array.size:
+            # One fused pass instead of three full sweeps
+            min_value, max_value, mean_value = min_max_mean(pixel_array.ravel())
+        else:
+            min_value, max_value, mean_value = np.min(pixel_array), np.max(pixel_array), np.mean(pixel_array)
+        
+        # Add DICOM-specific info if available
+        return ImageStats(
             shape=pixel_array.shape,
             dtype=str(pixel_array.dtype),
-            min_value=float(np.min(pixel_array)),
-            max_value=float(np.max(pixel_array)),
-            mean_value=float(np.mean(pixel_array)),
-            has_pixel_data=True
+            min_value=float(min_value),
+            max_value=float(max_value),
+            mean_value=float(mean_value),
+            has_pixel_data=True,
+            bits_allocated=getattr(ds, 'BitsAllocated', None) if ds else None,
+            bits_stored=getattr(ds, 'BitsStored', None) if ds else None,
+            photometric_interpretation=getattr(ds, 'PhotometricInterpretation', None) if ds else None
         )
-        
-        # Add DICOM-specific info if available
-        if ds:
-            stats.bits_allocated = getattr(ds, 'BitsAllocated', None)
-            stats.bits_stored = getattr(ds, 'BitsStored', None)
-            stats.photometric_interpretation = getattr(ds, 'PhotometricInterpretation', None)
-        
-        return stats
 
 class ImageComparator:
     """Compare DICOM image pixel data"""
     
-    def __init__(self, tolerance: float = 0.0, normalize: bool = True):
+    def __init__(self, tolerance: float = 0.0, normalize: bool = True,
+                 cache_budget_bytes: int = DEFAULT_PIXEL_CACHE_BYTES,
+                 decoding_plugin: Optional[str] = None,
+                 quick_reject: bool = False, quick_factor: int = 8):
         self.tolerance = tolerance
-        self.processor = ImageProcessor(normalize=normalize)
+        self.quick_reject = quick_reject
+        self.quick_factor = quick_factor
+        
+        # Difference buffer reused across comparisons, grown on demand
+        self._scratch: Optional[np.ndarray] = None
+        self.processor = ImageProcessor(
+            normalize=normalize, cache_budget_bytes=cache_budget_bytes,
+            decoding_plugin=decoding_plugin
+        )
         self.normalize = normalize
     
     def compare_studies(
@@ -108,50 +586,96 @@ class ImageComparator:
         comparison_file: str
     ) -> ImageFileComparisonResult:
         """Compare images between two study sets"""
+        return self.compare_study_sets(
+            baseline_studies, [(comparison_file, comparison_studies)], baseline_file
+        )[0]
+    
+    def compare_study_sets(
+        self,
+        baseline_studies: Dict[str, DicomStudy],
+        comparison_sets: List[Tuple[str, Dict[str, DicomStudy]]],
+        baseline_file: str
+    ) -> List[ImageFileComparisonResult]:
+        """
+        Compare images of one baseline against several comparison study sets
         
+        Every comparison of a baseline image is done by the same task, one after
+        the other, so the baseline pixels are decoded once and then served from
+        the pixel cache of whichever process runs it. Large runs share a single
+        worker pool across all comparison files.
+        
+        Returns:
+            One ImageFileComparisonResult per comparison set, in the given order
+        """
         # Build instance lookups (same as tag comparison)
         baseline_instances = self._build_instance_lookup(baseline_studies)
-        comparison_instances = self._build_instance_lookup(comparison_studies)
+        comparison_lookups = [
+            (comparison_file, self._build_instance_lookup(comparison_studies))
+            for comparison_file, comparison_studies in comparison_sets
+        ]
         
-        # Find matches and compare
-        image_comparisons = []
-        missing_instances = []
-        extra_instances = []
+        # Group the matched pairs of each baseline SOP Instance UID across all comparison files
+        groups = []
+        for sop_uid, baseline_instance in baseline_instances.items():
+            group = [
+                (file_idx, (baseline_instance, comparison_instances[sop_uid], baseline_file, comparison_file))
+                for file_idx, (comparison_file, comparison_instances) in enumerate(comparison_lookups)
+                if sop_uid in comparison_instances
+            ]
+            if group:
+                groups.append(group)
         
-        baseline_sop_uids = set(baseline_instances.keys())
-        comparison_sop_uids = set(comparison_instances.keys())
+        pairs = [pair for group in groups for pair in group]
+        tasks = [task for _, task in pairs]
         
-        # Compare matched instances
-        common_sop_uids = baseline_sop_uids.intersection(comparison_sop_uids)
-        for sop_uid in common_sop_uids:
-            baseline_instance = baseline_instances[sop_uid]
-            comparison_instance = comparison_instances[sop_uid]
+        if len(tasks) < PARALLEL_MIN_IMAGES or (os.cpu_count() or 1) < 2:
+            comparisons = self._compare_pairs(tasks)
+        else:
+            # Each comparison is independent file I/O + decode + reductions;
+            # workers split the pixel cache budget between them
+            workers = os.cpu_count()
+            chunks = []
+            for group in groups:
+                if not chunks or len(chunks[-1]) >= POOL_CHUNK_SIZE:
+                    chunks.append([])
+                chunks[-1].extend(task for _, task in group)
             
-            image_comparison = self.compare_images(
-                baseline_instance, comparison_instance,
-                baseline_file, comparison_file
-            )
-            image_comparisons.append(image_comparison)
+            comparisons = []
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=worker_context(), initializer=_init_worker,
+                initargs=(self.tolerance, self.normalize,
+                          self.processor.cache_budget_bytes // workers, self.processor.decoding_plugin,
+                          self.quick_reject, self.quick_factor)
+            ) as executor:
+                for chunk_results in executor.map(_compare_chunk, chunks):
+                    comparisons.extend(chunk_results)
         
-        # Find missing/extra instances
-        missing_sop_uids = baseline_sop_uids - comparison_sop_uids
-        for sop_uid in missing_sop_uids:
-            missing_instances.append(baseline_instances[sop_uid])
+        # Hand each comparison back to its file's results
+        image_comparisons = [[] for _ in comparison_lookups]
+        for (file_idx, _), comparison in zip(pairs, comparisons):
+            image_comparisons[file_idx].append(comparison)
         
-        extra_sop_uids = comparison_sop_uids - baseline_sop_uids
-        for sop_uid in extra_sop_uids:
-            extra_instances.append(comparison_instances[sop_uid])
+        results = []
+        for file_idx, (comparison_file, comparison_instances) in enumerate(comparison_lookups):
+            baseline_sop_uids = baseline_instances.keys()
+            comparison_sop_uids = comparison_instances.keys()
+            
+            # Find missing/extra instances (key views support set operations without copying)
+            missing_instances = [baseline_instances[sop_uid] for sop_uid in baseline_sop_uids - comparison_sop_uids]
+            extra_instances = [comparison_instances[sop_uid] for sop_uid in comparison_sop_uids - baseline_sop_uids]
+            
+            results.append(ImageFileComparisonResult(
+                baseline_file=baseline_file,
+                comparison_file=comparison_file,
+                image_comparisons=image_comparisons[file_idx],
+                missing_instances=missing_instances,
+                extra_instances=extra_instances,
+                total_instances_baseline=len(baseline_instances),
+                total_instances_comparison=len(comparison_instances),
+                tolerance_used=self.tolerance
+            ))
         
-        return ImageFileComparisonResult(
-            baseline_file=baseline_file,
-            comparison_file=comparison_file,
-            image_comparisons=image_comparisons,
-            missing_instances=missing_instances,
-            extra_instances=extra_instances,
-            total_instances_baseline=len(baseline_instances),
-            total_instances_comparison=len(comparison_instances),
-            tolerance_used=self.tolerance
-        )
+        return results
     
     def compare_images(
         self,
@@ -161,10 +685,86 @@ class ImageComparator:
         comparison_file: str
     ) -> ImageComparisonResult:
         """Compare pixel data between two DICOM instances"""
+        prepared = self._prepare_pair(baseline_instance, comparison_instance, baseline_file, comparison_file)
+        if isinstance(prepared, ImageComparisonResult):
+            return prepared
+        
+        # Compare pixel values
+        baseline_pixels, comparison_pixels, baseline_stats, comparison_stats, voi_applied = prepared
+        return self._compare_pixel_values(
+            baseline_instance, comparison_instance,
+            baseline_pixels, comparison_pixels,
+            baseline_stats, comparison_stats,
+            baseline_file, comparison_file, voi_applied
+        )
+    
+    def _compare_pairs(
+        self, tasks: List[Tuple[DicomInstance, DicomInstance, str, str]]
+    ) -> List[ImageComparisonResult]:
+        """
+        Compare many instance pairs, batching small same-shaped images
+        
+        Pairs that need a full pixel comparison are grouped by (shape, dtype) and
+        reduced together as one (K, N) block, amortizing per-call NumPy overhead
+        across slices of a series. Results are returned in task order.
+        """
+        results: List[Optional[ImageComparisonResult]] = [None] * len(tasks)
+        pending: Dict[tuple, list] = {}
+        pending_bytes: Dict[tuple, int] = {}
+        
+        for idx, task in enumerate(tasks):
+            prepared = self._prepare_pair(*task)
+            if isinstance(prepared, ImageComparisonResult):
+                results[idx] = prepared
+                continue
+            
+            baseline_pixels, comparison_pixels, baseline_stats, comparison_stats, voi_applied = prepared
+            pair_bytes = baseline_pixels.nbytes + comparison_pixels.nbytes
+            
+            # Numba already fuses each pair into one pass; large images gain nothing from stacking
+            if HAS_NUMBA or pair_bytes > BATCH_MAX_BYTES // 2:
+                results[idx] = self._compare_pixel_values(
+                    task[0], task[1], baseline_pixels, comparison_pixels,
+                    baseline_stats, comparison_stats, task[2], task[3], voi_applied
+                )
+                continue
+            
+            key = (baseline_pixels.shape, baseline_pixels.dtype, comparison_pixels.dtype, voi_applied)
+            pending.setdefault(key, []).append((idx, task, prepared))
+            pending_bytes[key] = pending_bytes.get(key, 0) + pair_bytes
+            
+            if pending_bytes[key] >= BATCH_MAX_BYTES:
+                self._compare_pixel_values_batch(pending.pop(key), results)
+                del pending_bytes[key]
+        
+        for group in pending.values():
+            self._compare_pixel_values_batch(group, results)
+        
+        return results
+    
+    def _prepare_pair(
+        self,
+        baseline_instance: DicomInstance,
+        comparison_instance: DicomInstance,
+        baseline_file: str,
+        comparison_file: str
+    ):
+        """
+        Load both images and resolve every outcome that needs no pixel arithmetic
+        
+        Returns:
+            A finished ImageComparisonResult, or a tuple of
+            (baseline_pixels, comparison_pixels, baseline_stats, comparison_stats, voi_applied)
+            when a full pixel comparison is required
+        """
+        # Window to display levels only when both sides carry a VOI window; otherwise
+        # compare both in modality units so the tolerance never spans two scales
+        voi_applied = (self.normalize and _has_voi_window(baseline_instance)
+                       and _has_voi_window(comparison_instance))
         
         # Extract pixel data
-        baseline_pixels = self.processor.extract_pixel_data(baseline_instance)
-        comparison_pixels = self.processor.extract_pixel_data(comparison_instance)
+        baseline_pixels = self.processor.extract_pixel_data(baseline_instance, voi_applied)
+        comparison_pixels = self.processor.extract_pixel_data(comparison_instance, voi_applied)
         
         # Get image statistics
         baseline_stats = self.processor.get_image_stats(baseline_pixels)
@@ -182,7 +782,8 @@ class ImageComparator:
                 baseline_stats=baseline_stats,
                 comparison_stats=comparison_stats,
                 normalization_applied=self.normalize,
-                tolerance_used=self.tolerance
+                tolerance_used=self.tolerance,
+                voi_applied=voi_applied
             )
         
         # Check dimensions
@@ -197,34 +798,115 @@ class ImageComparator:
                 baseline_stats=baseline_stats,
                 comparison_stats=comparison_stats,
                 normalization_applied=self.normalize,
-                tolerance_used=self.tolerance
+                tolerance_used=self.tolerance,
+                voi_applied=voi_applied
             )
         
-        # Compare pixel values
-        return self._compare_pixel_values(
-            baseline_instance, comparison_instance,
-            baseline_pixels, comparison_pixels,
-            baseline_stats, comparison_stats,
-            baseline_file, comparison_file
+        # Optional cheap screen on a strided subsample for clearly different images
+        if self.quick_reject:
+            quick_result = self._quick_reject(
+                baseline_instance, baseline_pixels, comparison_pixels,
+                baseline_stats, comparison_stats, baseline_file, comparison_file, voi_applied
+            )
+            if quick_result is not None:
+                return quick_result
+        
+        # Bit-identical images need no pixel arithmetic
+        if self.tolerance == 0.0 and self._pixels_identical(baseline_pixels, comparison_pixels):
+            return ImageComparisonResult(
+                sop_instance_uid=baseline_instance.sop_instance_uid,
+                baseline_file=baseline_file,
+                comparison_file=comparison_file,
+                is_exact_match=True,
+                difference_type=ImageDifferenceType.EXACT_MATCH,
+                similarity_score=1.0,
+                pixel_differences=0,
+                max_difference=0.0,
+                mean_difference=0.0,
+                rmse=0.0,
+                baseline_stats=baseline_stats,
+                comparison_stats=comparison_stats,
+                normalization_applied=self.normalize,
+                tolerance_used=self.tolerance,
+                voi_applied=voi_applied
+            )
+        
+        return baseline_pixels, comparison_pixels, baseline_stats, comparison_stats, voi_applied
+    
+    def _quick_reject(
+        self, baseline_instance, baseline_pixels, comparison_pixels,
+        baseline_stats, comparison_stats, baseline_file, comparison_file, voi_applied
+    ) -> Optional[ImageComparisonResult]:
+        """
+        Compare every Nth pixel and return an approximate result if the images clearly differ
+        
+        Returns None when the subsample doesn't exceed the tolerance margin and a
+        full-resolution comparison is still needed.
+        """
+        step = self.quick_factor * self.quick_factor
+        baseline_sample = baseline_pixels.reshape(-1)[::step]
+        comparison_sample = comparison_pixels.reshape(-1)[::step]
+        
+        max_diff, sum_diff, sum_sq, different_pixels = _diff_stats(
+            baseline_sample, comparison_sample, self.tolerance, self._get_scratch
+        )
+        if max_diff <= self.tolerance * QUICK_REJECT_MARGIN:
+            return None
+        
+        # Extrapolate the sampled sums and count to the whole image, so the differing
+        # pixel count is an estimate in full-resolution pixels (mean, RMSE and
+        # similarity are unchanged by the scaling)
+        scale = baseline_pixels.size / baseline_sample.size
+        return self._pixel_value_result(
+            baseline_instance, baseline_file, comparison_file,
+            baseline_stats, comparison_stats, baseline_pixels.size,
+            max_diff, sum_diff * scale, sum_sq * scale, round(different_pixels * scale),
+            voi_applied, is_approximate=True
         )
     
     def _compare_pixel_values(
         self, baseline_instance, comparison_instance,
         baseline_pixels, comparison_pixels,
         baseline_stats, comparison_stats,
-        baseline_file, comparison_file
+        baseline_file, comparison_file, voi_applied
     ) -> ImageComparisonResult:
         """Detailed pixel-by-pixel comparison"""
+        max_diff, sum_diff, sum_sq, different_pixels = _diff_stats(
+            baseline_pixels, comparison_pixels, self.tolerance, self._get_scratch
+        )
+        
+        return self._pixel_value_result(
+            baseline_instance, baseline_file, comparison_file,
+            baseline_stats, comparison_stats, baseline_pixels.size,
+            max_diff, sum_diff, sum_sq, different_pixels, voi_applied
+        )
+    
+    def _compare_pixel_values_batch(self, group: list, results: list) -> None:
+        """Reduce a group of same-shaped pairs as one (K, N) block, filling results in place"""
+        baseline_block = np.stack([prepared[0].reshape(-1) for _, _, prepared in group])
+        comparison_block = np.stack([prepared[1].reshape(-1) for _, _, prepared in group])
         
-        # Calculate differences
-        diff_array = np.abs(baseline_pixels.astype(np.float64) - comparison_pixels.astype(np.float64))
+        max_diffs, sum_diffs, sum_sqs, different_counts = _diff_stats_batch(
+            baseline_block, comparison_block, self.tolerance, self._get_scratch
+        )
+        total_pixels = baseline_block.shape[1]
         
-        # Statistics
-        max_diff = np.max(diff_array)
-        mean_diff = np.mean(diff_array)
-        rmse = np.sqrt(np.mean(diff_array ** 2))
-        different_pixels = np.sum(diff_array > self.tolerance)
-        total_pixels = diff_array.size
+        for k, (idx, task, prepared) in enumerate(group):
+            results[idx] = self._pixel_value_result(
+                task[0], task[2], task[3], prepared[2], prepared[3], total_pixels,
+                float(max_diffs[k]), float(sum_diffs[k]), float(sum_sqs[k]), int(different_counts[k]),
+                prepared[4]
+            )
+    
+    def _pixel_value_result(
+        self, baseline_instance, baseline_file, comparison_file,
+        baseline_stats, comparison_stats, total_pixels,
+        max_diff, sum_diff, sum_sq, different_pixels,
+        voi_applied: bool, is_approximate: bool = False
+    ) -> ImageComparisonResult:
+        """Build a comparison result from difference statistics"""
+        mean_diff = sum_diff / total_pixels
+        rmse = math.sqrt(sum_sq / total_pixels)
         
         # Similarity score
         similarity = 1.0 - (different_pixels / total_pixels)
@@ -247,14 +929,32 @@ class ImageComparator:
             baseline_stats=baseline_stats,
             comparison_stats=comparison_stats,
             normalization_applied=self.normalize,
-            tolerance_used=self.tolerance
+            tolerance_used=self.tolerance,
+            is_approximate=is_approximate,
+            voi_applied=voi_applied
         )
     
+    def _get_scratch(self, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        """Return a view of the shared scratch buffer with the requested shape and dtype"""
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        if self._scratch is None or self._scratch.size < nbytes:
+            self._scratch = np.empty(nbytes, dtype=np.uint8)
+        return self._scratch[:nbytes].view(dtype).reshape(shape)
+    
+    def _pixels_identical(self, baseline_pixels: np.ndarray, comparison_pixels: np.ndarray) -> bool:
+        """Check bit-identity of the pixel buffers (shapes already match)"""
+        if baseline_pixels.dtype != comparison_pixels.dtype:
+            return bool(np.array_equal(baseline_pixels, comparison_pixels))
+        
+        return _bitwise_equal(baseline_pixels, comparison_pixels)
+    
     def _build_instance_lookup(self, studies: Dict[str, DicomStudy]) -> Dict[str, DicomInstance]:
         """Build flat lookup of instances by SOPInstanceUID"""
-        instances = {}
-        for study in studies.values():
-            for series in study.series.values():
-                for instance in series.instances.values():
-                    instances[instance.sop_instance_uid] = instance
-        return instances
\ No newline at end of file
+        return {
+            instance.sop_instance_uid: instance
+            for instance in chain.from_iterable(
+                series.instances.values()
+                for study in studies.values()
+                for series in study.series.values()
+            )
+        }
\ No newline at end of file
@@ -1,7 +1,11 @@
 from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
 from typing import List, Optional, Tuple
 from enum import Enum
 
+import numpy as np
+
 class ImageDifferenceType(Enum):
     EXACT_MATCH = "EXACT_MATCH"
     PIXEL_VALUE_DIFF = "PIXEL_VALUE_DIFF"
@@ -10,7 +14,7 @@ class ImageDifferenceType(Enum):
     FORMAT_DIFF = "FORMAT_DIFF"
     NORMALIZATION_DIFF = "NORMALIZATION_DIFF"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImageStats:
     """Statistical information about an image"""
     shape: Tuple[int, ...]
@@ -23,7 +27,7 @@ class ImageStats:
     bits_stored: Optional[int] = None
     photometric_interpretation: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImageComparisonResult:
     """Result of comparing two DICOM images"""
     sop_instance_uid: str
@@ -46,6 +50,8 @@ class ImageComparisonResult:
     # Processing notes
     normalization_applied: bool = False
     tolerance_used: float = 0.0
+    is_approximate: bool = False  # Statistics come from a subsampled quick-reject pass
+    voi_applied: bool = False  # Pixels were windowed to 0-255 display levels, not modality units
 
 @dataclass
 class ImageFileComparisonResult:
@@ -65,19 +71,47 @@ class ImageFileComparisonResult:
         if self.extra_instances is None:
             self.extra_instances = []
     
-    @property
+    @cached_property
+    def baseline_name(self) -> str:
+        """File name of the baseline ZIP, for display"""
+        return Path(self.baseline_file).name
+    
+    @cached_property
+    def comparison_name(self) -> str:
+        """File name of the comparison ZIP, for display"""
+        return Path(self.comparison_file).name
+    
+    @cached_property
+    def similarity_scores(self) -> np.ndarray:
+        """Similarity score of every image comparison, gathered once"""
+        return np.fromiter(
+            (comp.similarity_score for comp in self.image_comparisons),
+            dtype=np.float64, count=len(self.image_comparisons)
+        )
+    
+    @cached_property
     def exact_matches(self) -> int:
-        return sum(1 for comp in self.image_comparisons if comp.is_exact_match)
+        return sum(comp.is_exact_match for comp in self.image_comparisons)
+    
+    @cached_property
+    def approximate_count(self) -> int:
+        """Comparisons whose statistics were estimated from a --quick-reject subsample"""
+        return sum(comp.is_approximate for comp in self.image_comparisons)
+    
+    @cached_property
+    def voi_applied_count(self) -> int:
+        """Comparisons made on VOI LUT display levels rather than modality values"""
+        return sum(comp.voi_applied for comp in self.image_comparisons)
     
     @property
     def pixel_differences(self) -> int:
         return len(self.image_comparisons) - self.exact_matches
     
-    @property
+    @cached_property
     def average_similarity(self) -> float:
         if not self.image_comparisons:
             return 0.0
-        return sum(comp.similarity_score for comp in self.image_comparisons) / len(self.image_comparisons)
+        return float(self.similarity_scores.mean())
 
 @dataclass
 class ImageComparisonSummary:
@@ -89,15 +123,30 @@ class ImageComparisonSummary:
     normalization_applied: bool
     total_images_compared: int
     
-    @property
+    @cached_property
     def overall_exact_matches(self) -> int:
         return sum(result.exact_matches for result in self.file_results)
     
-    @property
+    @cached_property
+    def tolerance_units(self) -> str:
+        """Unit the tolerance and difference statistics were measured in"""
+        if not self.normalization_applied:
+            return "stored pixel values"
+        
+        windowed = sum(result.voi_applied_count for result in self.file_results)
+        if windowed == 0:
+            return "modality values"
+        if windowed == self.total_images_compared:
+            return "display levels 0-255"
+        return (f"display levels 0-255 for {windowed} windowed pair(s), "
+                f"modality values for {self.total_images_compared - windowed}")
+    
+    @cached_property
     def overall_similarity(self) -> float:
         if not self.file_results:
             return 0.0
-        total_similarity = sum(result.average_similarity * len(result.image_comparisons) 
-                             for result in self.file_results)
+        # Every file's mean is weighted by its image count, so this is the mean over all scores
         total_comparisons = sum(len(result.image_comparisons) for result in self.file_results)
-        return total_similarity / total_comparisons if total_comparisons > 0 else 0.0
\ No newline at end of file
+        if total_comparisons == 0:
+            return 0.0
+        return float(sum(result.similarity_scores.sum() for result in self.file_results) / total_comparisons)
@@ -0,0 +1,57 @@
+"""Optional Numba-accelerated numeric kernels
+
+Numba is not a hard dependency. Callers check HAS_NUMBA and fall back to
+their NumPy implementation when it is not installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def diff_reduce(a, b, tol):
+        """
+        Fused single pass over two flat arrays of equal length
+
+        Returns:
+            Tuple of (max_diff, sum_diff, sum_sq_diff, count_above_tol)
+        """
+        mx = 0.0
+        s = 0.0
+        sq = 0.0
+        cnt = 0
+        for i in prange(a.size):
+            d = abs(np.float64(a[i]) - np.float64(b[i]))
+            mx = max(mx, d)
+            s += d
+            sq += d * d
+            if d > tol:
+                cnt += 1
+        return mx, s, sq, cnt
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def min_max_mean(a):
+        """
+        Fused single pass over a flat, non-empty array
+
+        Returns:
+            Tuple of (min, max, mean)
+        """
+        lo = np.inf
+        hi = -np.inf
+        s = 0.0
+        for i in prange(a.size):
+            v = np.float64(a[i])
+            lo = min(lo, v)
+            hi = max(hi, v)
+            s += v
+        return lo, hi, s / a.size
+else:
+    diff_reduce = None
+    min_max_mean = None
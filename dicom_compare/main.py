@@ -1,33 +1,30 @@
+import bisect
+import importlib.util
+import os
 import typer
-from typing import List, Optional
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import chain, islice
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
+from rich.text import Text
 from rich.table import Table
 from rich import print as rprint
 from collections import defaultdict, Counter
 import pydicom
 
-# Excel availability check
-try:
-    import pandas as pd
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.chart import PieChart, BarChart, Reference
-    from openpyxl.chart.series import DataPoint, SeriesLabel
-    from openpyxl.utils.dataframe import dataframe_to_rows
-    EXCEL_AVAILABLE = True
-except ImportError as e:
-    EXCEL_AVAILABLE = False
-    pd = None
-    console = Console()  # Create console here for error message
-    console.print(f"⚠️  Excel dependencies not available: {e}", style="yellow")
-
-from dicom_compare.dicom_extractor import DicomExtractor, ExtractionStats
-from dicom_compare.dicom_loader import DicomLoader
+# Excel availability check - openpyxl itself is only imported when a report is written
+EXCEL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
+if not EXCEL_AVAILABLE:
+    Console().print("⚠️  Excel dependencies not available: No module named 'openpyxl'", style="yellow")
+
+from dicom_compare.dicom_extractor import DicomExtractor, ExtractionStats, DEFAULT_EXTRACT_JOBS, member_extract_jobs
+from dicom_compare.dicom_loader import DicomLoader, DicomStudy
 from dicom_compare.dicom_comparator import DicomComparator
-from dicom_compare.models import ComparisonSummary, FileComparisonResult
-from dicom_compare.utils import validate_inputs, create_temp_dir, cleanup_temp_dirs
+from dicom_compare.models import ComparisonSummary, FileComparisonResult, DifferenceType
+from dicom_compare.utils import validate_inputs, create_temp_dir, cleanup_temp_dirs, worker_context, CSV_BUFFER_SIZE
 from dicom_compare.image_command import run_image_comparison
 from dicom_compare.hierarchical_loader import HierarchicalDicomLoader
 from dicom_compare.tag_search import TagSearchEngine, InteractiveSearchSession
@@ -40,6 +37,23 @@ app = typer.Typer(
 
 console = Console()
 
+# Accepted --matching-mode values, in the order the error message lists them
+MATCHING_MODES = ("uid", "hash", "fingerprint", "smart")
+
+# Tag analysis column for each difference type, in display order
+DIFF_TYPE_KEYS = {
+    DifferenceType.MISSING_TAG: 'missing',
+    DifferenceType.EXTRA_TAG: 'extra',
+    DifferenceType.VALUE_DIFF: 'value_diff',
+    DifferenceType.TYPE_DIFF: 'type_diff',
+}
+
+# Quality grades by data integrity %: ascending lower bounds, and the grade below
+# the first bound followed by the grade reached at each bound
+QUALITY_GRADES = ((60, 70, 80, 85, 90, 95), ("F", "D", "C", "B", "B+", "A", "A+"))
+# The Excel comparison sheet has no F grade
+EXCEL_QUALITY_GRADES = ((70, 80, 85, 90, 95), ("D", "C", "B", "B+", "A", "A+"))
+
 @app.command("image")
 def compare_images(
     files: List[Path] = typer.Option(
@@ -58,13 +72,31 @@ def compare_images(
         0.0,
         "-t",
         "--tolerance",
-        help="Tolerance for pixel differences (0.0 = exact match, higher = more tolerant)"
+        help="Tolerance for pixel differences (0.0 = exact match, higher = more tolerant). "
+             "Measured in 0-255 display levels when both images carry a VOI window, "
+             "otherwise in modality values (stored values with --no-normalize)"
     ),
     normalize: bool = typer.Option(
         True,
         "--normalize/--no-normalize",
         help="Apply DICOM normalization (rescale slope/intercept, window/level)"
     ),
+    decoder: Optional[str] = typer.Option(
+        None,
+        "--decoder",
+        help="Preferred decoding plugin for compressed images (pylibjpeg, gdcm, pillow); fastest available by default"
+    ),
+    quick_reject: bool = typer.Option(
+        False,
+        "--quick-reject",
+        help="Skip the full-resolution pass for clearly different images (statistics become approximate)"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "-j",
+        "--jobs",
+        help="Number of ZIP files to extract in parallel (default: one per file, up to 8)"
+    ),
     verbose: bool = typer.Option(
         False,
         "-v",
@@ -79,7 +111,7 @@ def compare_images(
     just the metadata tags. Useful for validating that image data is preserved 
     across different export methods.
     """
-    run_image_comparison(files, report, tolerance, normalize, verbose)
+    run_image_comparison(files, report, tolerance, normalize, verbose, decoder, quick_reject, jobs)
 
 # Create inspect command group
 inspect_app = typer.Typer(
@@ -95,6 +127,12 @@ def inspect_files(
         "-f",
         "--file",
         help="ZIP files to inspect"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "-j",
+        "--jobs",
+        help="Number of ZIP files to scan in parallel (default: one per file, up to 8)"
     )
 ):
     """
@@ -102,61 +140,67 @@ def inspect_files(
     """
     console.print("🔍 Inspecting ZIP files...", style="blue")
 
-    temp_dirs = []
-    try:
-        extractor = DicomExtractor()
-
-        for file in files:
-            console.print(f"\n📦 Inspecting {file.name}:", style="bold cyan")
-
-            temp_dir = create_temp_dir()
-            temp_dirs.append(temp_dir)
-
-            # Extract
-            extracted_path, stats = extractor.extract_zip(file, temp_dir)
-
-            # Find DICOMs
-            dicom_files = extractor.find_dicom_files(extracted_path)
-
-            if dicom_files:
-                console.print(f"\n✅ Found {len(dicom_files)} DICOM files", style="green")
-
-                # Group by directory
-                by_directory = defaultdict(list)
-                for dicom_file in dicom_files:
-                    relative_path = dicom_file.relative_to(extracted_path)
-                    directory = str(relative_path.parent)
-                    by_directory[directory].append(relative_path.name)
-
-                for directory, files in by_directory.items():
-                    console.print(f"   📁 {directory}: {len(files)} DICOM files", style="cyan")
-                    for dicom_file in files[:3]:  # Show first 3 files per directory
-                        console.print(f"      {dicom_file}", style="dim")
-                    if len(files) > 3:
-                        console.print(f"      ... and {len(files) - 3} more files", style="dim")
+    extractor = DicomExtractor()
+
+    # Listing only needs each member's header, so archives are scanned in place
+    # (in parallel) instead of being extracted to temp directories
+    if jobs is None:
+        jobs = min(DEFAULT_EXTRACT_JOBS, len(files))
+    with ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+        scanned = list(pool.map(extractor.find_dicom_members, files))
+
+    for file, (dicom_members, stats, summary_lines) in zip(files, scanned):
+        # Each archive's report is collected and printed in one go rather than line by line
+        lines = [
+            Text(f"\n📦 Inspecting {file.name}:", style="bold cyan"),
+            *summary_lines,
+            Text(f"   Found {len(dicom_members)} DICOM files", style="green"),
+        ]
 
-                # Load first few to check SOPInstanceUIDs
-                console.print(f"\n🔍 Checking DICOM content:", style="cyan")
-                for i, dicom_file in enumerate(dicom_files[:5]):  # Check first 5
+        if dicom_members:
+            lines.append(Text(f"\n✅ Found {len(dicom_members)} DICOM files", style="green"))
+
+            # Group by directory, keeping only the names that get shown (first 3 per directory)
+            dir_counts = Counter()
+            dir_samples = defaultdict(list)
+            for member in dicom_members:
+                directory, sep, name = member.rpartition('/')
+                directory = directory if sep else '.'
+                dir_counts[directory] += 1
+                if len(dir_samples[directory]) < 3:
+                    dir_samples[directory].append(name)
+
+            for directory, count in dir_counts.items():
+                lines.append(Text(f"   📁 {directory}: {count} DICOM files", style="cyan"))
+                for name in dir_samples[directory]:
+                    lines.append(Text(f"      {name}", style="dim"))
+                if count > 3:
+                    lines.append(Text(f"      ... and {count - 3} more files", style="dim"))
+
+            # Load first few to check SOPInstanceUIDs
+            lines.append(Text(f"\n🔍 Checking DICOM content:", style="cyan"))
+            with zipfile.ZipFile(file) as zip_ref:
+                for member in dicom_members[:5]:  # Check first 5
                     try:
 
-                        ds = pydicom.dcmread(dicom_file, stop_before_pixels=True)
+                        # Only the two UIDs are shown, so skip decoding every other element
+                        with zip_ref.open(member) as f:
+                            ds = pydicom.dcmread(f, stop_before_pixels=True,
+                                                 specific_tags=['SOPInstanceUID', 'SeriesInstanceUID'])
                         sop_uid = getattr(ds, 'SOPInstanceUID', 'MISSING')
                         series_uid = getattr(ds, 'SeriesInstanceUID', 'MISSING')
-                        relative_path = dicom_file.relative_to(extracted_path)
-                        console.print(f"   📄 {relative_path}", style="dim")
-                        console.print(f"      SOPInstanceUID = {sop_uid}", style="dim")
-                        console.print(f"      SeriesInstanceUID = {series_uid}", style="dim")
+                        lines.append(Text(f"   📄 {member}", style="dim"))
+                        lines.append(Text(f"      SOPInstanceUID = {sop_uid}", style="dim"))
+                        lines.append(Text(f"      SeriesInstanceUID = {series_uid}", style="dim"))
                     except Exception as e:
-                        console.print(f"   ❌ {dicom_file.name}: Error reading - {e}", style="red")
+                        lines.append(Text(f"   ❌ {member.rpartition('/')[2]}: Error reading - {e}", style="red"))
 
-                if len(dicom_files) > 5:
-                    console.print(f"   ... and {len(dicom_files) - 5} more DICOM files", style="dim")
-            else:
-                console.print("❌ No DICOM files found", style="red")
+            if len(dicom_members) > 5:
+                lines.append(Text(f"   ... and {len(dicom_members) - 5} more DICOM files", style="dim"))
+        else:
+            lines.append(Text("❌ No DICOM files found", style="red"))
 
-    finally:
-        cleanup_temp_dirs(temp_dirs)
+        console.print(Group(*lines))
 
 @inspect_app.command("search")
 def inspect_search(
@@ -166,6 +210,11 @@ def inspect_search(
         "--file",
         help="ZIP files to search"
     ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse DICOM data cached by earlier inspect runs on the same, unchanged files"
+    ),
     interactive: bool = typer.Option(
         True,
         "--interactive/--no-interactive",
@@ -190,7 +239,7 @@ def inspect_search(
 
     try:
         # Load hierarchical data
-        loader = HierarchicalDicomLoader(verbose=False)  # Search is always quiet by default
+        loader = HierarchicalDicomLoader(verbose=False, use_cache=cache)  # Search is always quiet by default
         data = loader.load_hierarchical_data(files)
 
         # Create search engine
@@ -222,6 +271,11 @@ def inspect_patient(
         "--file",
         help="ZIP files to inspect"
     ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse DICOM data cached by earlier inspect runs on the same, unchanged files"
+    ),
     patient_id: Optional[str] = typer.Option(
         None,
         "--patient-id",
@@ -251,21 +305,17 @@ def inspect_patient(
 
     try:
         # Load hierarchical data
-        loader = HierarchicalDicomLoader(verbose=verbose)
+        loader = HierarchicalDicomLoader(verbose=verbose, use_cache=cache)
         data = loader.load_hierarchical_data(files)
 
         # Filter by patient ID if specified
         patients_to_show = {}
         if patient_id:
-            # Look for exact or fuzzy match
-            found_patient = None
-            for pid, patient in data.patients.items():
-                if pid == patient_id or patient_id.lower() in pid.lower():
-                    found_patient = patient
-                    patients_to_show[pid] = patient
-                    break
-
-            if not found_patient:
+            # Look for exact or partial match
+            match = _find_by_id(data.patients, patient_id, ignore_case=True)
+            if match:
+                patients_to_show[match[0]] = match[1]
+            else:
                 console.print(f"❌ Patient ID '{patient_id}' not found", style="red")
                 _list_available_patients(data.patients, console)
                 return
@@ -287,6 +337,11 @@ def inspect_study(
         "--file",
         help="ZIP files to inspect"
     ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse DICOM data cached by earlier inspect runs on the same, unchanged files"
+    ),
     study_uid: Optional[str] = typer.Option(
         None,
         "--study-uid",
@@ -316,7 +371,7 @@ def inspect_study(
 
     try:
         # Load hierarchical data
-        loader = HierarchicalDicomLoader(verbose=verbose)
+        loader = HierarchicalDicomLoader(verbose=verbose, use_cache=cache)
         data = loader.load_hierarchical_data(files)
 
         # Filter studies
@@ -324,26 +379,24 @@ def inspect_study(
 
         if study_uid:
             # Look for specific study
-            found_study = None
-            for uid, study in data.studies.items():
-                if uid == study_uid or study_uid in uid:
-                    found_study = study
-                    studies_to_show[uid] = study
-                    break
-
-            if not found_study:
+            match = _find_by_id(data.studies, study_uid)
+            if match:
+                studies_to_show[match[0]] = match[1]
+            else:
                 console.print(f"❌ Study UID '{study_uid}' not found", style="red")
                 _list_available_studies(data.studies, console)
                 return
         elif patient_id:
-            # Filter by patient
-            patient_found = False
-            for uid, study in data.studies.items():
-                if study.patient_id == patient_id or patient_id.lower() in study.patient_id.lower():
-                    studies_to_show[uid] = study
-                    patient_found = True
-
-            if not patient_found:
+            # Filter by patient; an exact ID reads its study list directly
+            patient = data.patients.get(patient_id)
+            if patient is not None:
+                studies_to_show = {uid: data.studies[uid] for uid in patient.studies if uid in data.studies}
+            else:
+                for uid, study in data.studies.items():
+                    if patient_id.lower() in study.patient_id.lower():
+                        studies_to_show[uid] = study
+
+            if not studies_to_show:
                 console.print(f"❌ No studies found for patient '{patient_id}'", style="red")
                 return
         else:
@@ -364,6 +417,11 @@ def inspect_series(
         "--file",
         help="ZIP files to inspect"
     ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse DICOM data cached by earlier inspect runs on the same, unchanged files"
+    ),
     series_uid: Optional[str] = typer.Option(
         None,
         "--series-uid",
@@ -393,7 +451,7 @@ def inspect_series(
 
     try:
         # Load hierarchical data
-        loader = HierarchicalDicomLoader(verbose=verbose)
+        loader = HierarchicalDicomLoader(verbose=verbose, use_cache=cache)
         data = loader.load_hierarchical_data(files)
 
         # Filter series
@@ -401,26 +459,24 @@ def inspect_series(
 
         if series_uid:
             # Look for specific series
-            found_series = None
-            for uid, series in data.series.items():
-                if uid == series_uid or series_uid in uid:
-                    found_series = series
-                    series_to_show[uid] = series
-                    break
-
-            if not found_series:
+            match = _find_by_id(data.series, series_uid)
+            if match:
+                series_to_show[match[0]] = match[1]
+            else:
                 console.print(f"❌ Series UID '{series_uid}' not found", style="red")
                 _list_available_series(data.series, console)
                 return
         elif study_uid:
-            # Filter by study
-            study_found = False
-            for uid, series in data.series.items():
-                if series.study_uid == study_uid or study_uid in series.study_uid:
-                    series_to_show[uid] = series
-                    study_found = True
-
-            if not study_found:
+            # Filter by study; an exact UID reads its series list directly
+            study = data.studies.get(study_uid)
+            if study is not None:
+                series_to_show = {uid: data.series[uid] for uid in study.series if uid in data.series}
+            else:
+                for uid, series in data.series.items():
+                    if study_uid in series.study_uid:
+                        series_to_show[uid] = series
+
+            if not series_to_show:
                 console.print(f"❌ No series found for study '{study_uid}'", style="red")
                 return
         else:
@@ -441,6 +497,11 @@ def inspect_instance(
         "--file",
         help="ZIP files to inspect"
     ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse DICOM data cached by earlier inspect runs on the same, unchanged files"
+    ),
     sop_uid: Optional[str] = typer.Option(
         None,
         "--sop-uid",
@@ -475,7 +536,7 @@ def inspect_instance(
 
     try:
         # Load hierarchical data
-        loader = HierarchicalDicomLoader(verbose=verbose)
+        loader = HierarchicalDicomLoader(verbose=verbose, use_cache=cache)
         data = loader.load_hierarchical_data(files)
 
         # Filter instances
@@ -483,35 +544,36 @@ def inspect_instance(
 
         if sop_uid:
             # Look for specific instance
-            found_instance = None
-            for uid, instance in data.instances.items():
-                if uid == sop_uid or sop_uid in uid:
-                    found_instance = instance
-                    instances_to_show[uid] = instance
-                    break
-
-            if not found_instance:
+            match = _find_by_id(data.instances, sop_uid)
+            if match:
+                instances_to_show[match[0]] = match[1]
+            else:
                 console.print(f"❌ SOP Instance UID '{sop_uid}' not found", style="red")
                 _list_available_instances(data.instances, console, limit=5)
                 return
         elif series_uid:
-            # Filter by series
-            series_found = False
-            for uid, instance in data.instances.items():
-                if instance.series_uid == series_uid or series_uid in instance.series_uid:
-                    instances_to_show[uid] = instance
-                    series_found = True
-
-                    # Respect limit
-                    if len(instances_to_show) >= limit:
-                        break
-
-            if not series_found:
+            # Filter by series; an exact UID reads its instance list directly
+            series = data.series.get(series_uid)
+            if series is not None:
+                instances_to_show = {
+                    uid: data.instances[uid]
+                    for uid in islice(series.instances, limit) if uid in data.instances
+                }
+            else:
+                for uid, instance in data.instances.items():
+                    if series_uid in instance.series_uid:
+                        instances_to_show[uid] = instance
+
+                        # Respect limit
+                        if len(instances_to_show) >= limit:
+                            break
+
+            if not instances_to_show:
                 console.print(f"❌ No instances found for series '{series_uid}'", style="red")
                 return
         else:
             # Show first N instances
-            instances_to_show = dict(list(data.instances.items())[:limit])
+            instances_to_show = dict(islice(data.instances.items(), limit))
 
         # Display instance information
         _display_instance_info(instances_to_show, data, show_all_tags, console)
@@ -532,13 +594,19 @@ def compare(
         None,
         "-r",
         "--report",
-        help="Path to save CSV/Excel report (format determined by extension)"
+        help="Path to save CSV/Excel/Feather/Parquet report (format determined by extension)"
     ),
     matching_mode: str = typer.Option(
         "uid",
         "--matching-mode",
         help="Matching strategy: 'uid' (default), 'hash' (pixel hash), 'fingerprint' (statistical), 'smart' (cascading fallback)"
     ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "-j",
+        "--jobs",
+        help="Number of ZIP files to extract in parallel (default: one per file, up to 8)"
+    ),
     verbose: bool = typer.Option(
         False,
         "-v",
@@ -560,9 +628,8 @@ def compare(
             validate_report_path(report)
 
         # Validate matching mode
-        valid_modes = ["uid", "hash", "fingerprint", "smart"]
-        if matching_mode not in valid_modes:
-            raise ValueError(f"Invalid matching mode '{matching_mode}'. Must be one of: {', '.join(valid_modes)}")
+        if matching_mode not in MATCHING_MODES:
+            raise ValueError(f"Invalid matching mode '{matching_mode}'. Must be one of: {', '.join(MATCHING_MODES)}")
 
     except Exception as e:
         console.print(f"❌ {str(e)}", style="red")
@@ -571,32 +638,35 @@ def compare(
     console.print("🔍 Starting DICOM comparison...", style="blue")
     
     temp_dirs = []
-    extraction_stats = []
+    executor = None
     try:
-        # Extract ZIP files
-        console.print("📦 Extracting ZIP files...", style="yellow")
-        extractor = DicomExtractor(verbose=verbose)
-        extracted_paths = []
+        # Comparison files load and compare in worker processes once there is more than one
+        if len(files) > 2:
+            executor = ProcessPoolExecutor(
+                max_workers=min(len(files) - 1, os.cpu_count() or 1),
+                mp_context=worker_context()
+            )
         
-        for file in files:
-            temp_dir = create_temp_dir()
-            temp_dirs.append(temp_dir)
-            extracted_path, stats = extractor.extract_zip(file, temp_dir)
-            extracted_paths.append((str(file), extracted_path))
-            extraction_stats.append((str(file), stats))
-        
-        # Load DICOM files
-        console.print("🏥 Loading DICOM files...", style="yellow")
-        loader = DicomLoader(verbose=verbose)
-        loaded_studies = []
-        
-        for i, (file_name, path) in enumerate(extracted_paths):
-            studies = loader.load_dicom_files(path, file_name)
-            loaded_studies.append((file_name, studies))
-            
-            # Show results with extraction context
+        # UID matching never reopens the files, so it reads them straight out of the ZIPs;
+        # the pixel-based modes need them on disk
+        stream = matching_mode == "uid"
+        
+        # Extract ZIP files, loading each one as soon as it is on disk
+        if stream:
+            console.print("📦 Scanning ZIP files...", style="yellow")
+            console.print("🏥 Loading DICOM files from the archives...", style="yellow")
+        else:
+            console.print("📦 Extracting ZIP files...", style="yellow")
+            console.print("🏥 Loading DICOM files as they are extracted...", style="yellow")
+        extraction_stats, loaded_studies = _extract_and_load(files, temp_dirs, jobs, verbose, executor, stream)
+        
+        hierarchy_counts = []
+        for i, (file_name, studies) in enumerate(loaded_studies):
+            # Show results with extraction context; the counts are kept for the summary
+            total_series = sum(len(study.series) for study in studies.values())
             total_instances = sum(len(series.instances) for study in studies.values() 
                                 for series in study.series.values())
+            hierarchy_counts.append((len(studies), total_series))
             
             # Get corresponding extraction stats
             _, stats = extraction_stats[i]
@@ -617,29 +687,38 @@ def compare(
         baseline_name, baseline_studies = loaded_studies[0]
         comparison_results = []
 
-        for comp_name, comp_studies in loaded_studies[1:]:
-            result = comparator.compare_studies(
-                baseline_studies, comp_studies,
-                baseline_name, comp_name,
-                matching_mode=matching_mode
-            )
-            comparison_results.append(result)
+        if executor:
+            with executor:
+                futures = [
+                    executor.submit(_compare_worker, baseline_studies, comp_studies,
+                                    baseline_name, comp_name, matching_mode)
+                    for comp_name, comp_studies in loaded_studies[1:]
+                ]
+                comparison_results = [future.result() for future in futures]
+        else:
+            for comp_name, comp_studies in loaded_studies[1:]:
+                result = comparator.compare_studies(
+                    baseline_studies, comp_studies,
+                    baseline_name, comp_name,
+                    matching_mode=matching_mode
+                )
+                comparison_results.append(result)
         
         if verbose:
             console.print("\n🔍 Comparison Debug Info:", style="cyan")
             for i, (comp_name, comp_studies) in enumerate(loaded_studies[1:]):
                 result = comparison_results[i]
-                console.print(f"   {Path(comp_name).name}:", style="cyan")
+                console.print(f"   {result.comparison_name}:", style="cyan")
                 console.print(f"     Baseline instances: {result.total_instances_baseline}", style="dim")
                 console.print(f"     Comparison instances: {result.total_instances_comparison}", style="dim")
                 console.print(f"     Matched instances: {len(result.matched_instances)}", style="dim")
-                console.print(f"     Perfect matches: {sum(1 for comp in result.matched_instances if comp.is_perfect_match)}", style="dim")
-                console.print(f"     Tag differences: {sum(1 for comp in result.matched_instances if not comp.is_perfect_match)}", style="dim")
+                console.print(f"     Perfect matches: {result.perfect_matches}", style="dim")
+                console.print(f"     Tag differences: {result.tag_difference_count}", style="dim")
                 console.print(f"     Missing instances: {len(result.missing_instances)}", style="dim")
                 console.print(f"     Extra instances: {len(result.extra_instances)}", style="dim")
         
         # Create summary
-        summary = create_comparison_summary(baseline_name, comparison_results)
+        summary = create_comparison_summary(baseline_name, comparison_results, *hierarchy_counts[0])
         
         # Display results
         display_terminal_results(summary, console)
@@ -647,8 +726,8 @@ def compare(
         # Generate report if requested
         if report:
             console.print(f"📊 Generating report: {report}", style="green")
-            generate_report(summary, report)
-            console.print(f"✅ Report saved to: {report}", style="green")
+            written_path = generate_report(summary, report)
+            console.print(f"✅ Report saved to: {written_path}", style="green")
         
         console.print("🎉 Comparison completed successfully!", style="green")
         
@@ -659,28 +738,123 @@ def compare(
         raise typer.Exit(1)
     
     finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
         # Cleanup temporary directories
         cleanup_temp_dirs(temp_dirs)
 
+def _extract_and_load(
+    files: List[Path], temp_dirs: List[Path], jobs: Optional[int], verbose: bool,
+    executor: Optional[ProcessPoolExecutor], stream: bool = False
+) -> Tuple[List[Tuple[str, ExtractionStats]], List[Tuple[str, Dict[str, DicomStudy]]]]:
+    """
+    Extract ZIP files and load their DICOM files as a pipeline
+    
+    Extraction runs on a thread pool. As each archive finishes, its load is
+    queued straight away: comparison files go to the worker processes when an
+    executor is given, everything else to a single in-process loader thread.
+    
+    With stream=True nothing is extracted: each archive is only scanned for its
+    DICOM members, which the loaders then read straight out of the ZIP.
+    
+    Returns:
+        (extraction_stats, loaded_studies), both as (file_name, ...) lists in input order
+    """
+    extractor = DicomExtractor(verbose=verbose)
+    loader = DicomLoader(verbose=verbose)
+    
+    def load_here(path: Path, file_name: str, members: Optional[List[str]]) -> Tuple[str, Dict[str, DicomStudy]]:
+        return _load_worker(path, file_name, verbose, members, loader)
+    
+    targets = []
+    if not stream:
+        for _ in files:
+            temp_dir = create_temp_dir()
+            temp_dirs.append(temp_dir)
+            targets.append(temp_dir)
+    
+    extraction_stats = [None] * len(files)
+    load_futures = [None] * len(files)
+    jobs = jobs or min(DEFAULT_EXTRACT_JOBS, len(files))
+    
+    with ThreadPoolExecutor(max_workers=jobs) as extract_pool, \
+         ThreadPoolExecutor(max_workers=1) as load_thread:
+        if stream:
+            extract_futures = {
+                extract_pool.submit(extractor.find_dicom_members, file): i
+                for i, file in enumerate(files)
+            }
+        else:
+            extract_futures = {
+                extract_pool.submit(extractor.extract_zip, file, target, member_extract_jobs(jobs)): i
+                for i, (file, target) in enumerate(zip(files, targets))
+            }
+        
+        for future in as_completed(extract_futures):
+            i = extract_futures[future]
+            if stream:
+                members, stats, summary_lines = future.result()
+                console.print(Group(*summary_lines))
+                path = files[i]
+            else:
+                path, stats = future.result()
+                members = None
+            file_name = str(files[i])
+            extraction_stats[i] = (file_name, stats)
+            
+            if executor and i > 0:
+                load_futures[i] = executor.submit(_load_worker, path, file_name, verbose, members)
+            else:
+                load_futures[i] = load_thread.submit(load_here, path, file_name, members)
+        
+        loaded_studies = [future.result() for future in load_futures]
+    
+    return extraction_stats, loaded_studies
+
+def _load_worker(path: Path, file_name: str, verbose: bool, members: Optional[List[str]] = None,
+                 loader: Optional[DicomLoader] = None) -> Tuple[str, Dict[str, DicomStudy]]:
+    """
+    Load one ZIP in a worker process (module-level so it pickles)
+    
+    path is the extracted directory, or the ZIP itself when members lists the
+    DICOM files to read out of it.
+    """
+    if loader is None:
+        loader = DicomLoader(verbose=verbose, show_progress=False)
+    if members is not None:
+        return file_name, loader.load_dicom_zip(path, members, file_name)
+    return file_name, loader.load_dicom_files(path, file_name)
+
+def _compare_worker(baseline_studies: Dict[str, DicomStudy], comp_studies: Dict[str, DicomStudy],
+                    baseline_name: str, comp_name: str, matching_mode: str) -> FileComparisonResult:
+    """Compare one loaded file against the baseline in a worker process"""
+    return DicomComparator().compare_studies(
+        baseline_studies, comp_studies,
+        baseline_name, comp_name,
+        matching_mode=matching_mode
+    )
+
 def validate_report_path(report_path: Path) -> None:
     """Validate report path and format"""
-    if not report_path.suffix.lower() in ['.csv', '.xlsx']:
-        raise ValueError("Report format must be CSV (.csv) or Excel (.xlsx)")
+    if not report_path.suffix.lower() in ['.csv', '.xlsx', '.feather', '.parquet']:
+        raise ValueError("Report format must be CSV (.csv), Excel (.xlsx), Feather (.feather) or Parquet (.parquet)")
     
     # Ensure parent directory exists
     report_path.parent.mkdir(parents=True, exist_ok=True)
 
-def create_comparison_summary(baseline_name: str, results: List[FileComparisonResult]) -> ComparisonSummary:
-    """Create summary from comparison results"""
+def create_comparison_summary(baseline_name: str, results: List[FileComparisonResult],
+                              total_studies: int, total_series: int) -> ComparisonSummary:
+    """
+    Create summary from comparison results
+    
+    total_studies and total_series are the baseline's counts, taken while its
+    loaded studies were already being walked for the per-file summary.
+    """
     comparison_files = [result.comparison_file for result in results]
     
     # Calculate totals from results
     total_instances = results[0].total_instances_baseline if results else 0
     
-    # Count unique studies and series from baseline
-    total_studies = 1  # Simplified - we'll improve this later
-    total_series = 1   # Simplified - we'll improve this later
-    
     return ComparisonSummary(
         baseline_file=baseline_name,
         comparison_files=comparison_files,
@@ -703,18 +877,18 @@ def display_terminal_results(summary: 'ComparisonSummary', console: Console) ->
     # Create comprehensive results table
     table = Table(title="🔍 Detailed Comparison Results")
     table.add_column("File", style="cyan", width=25)
-    table.add_column("Perfect\nMatches", style="green", justify="right")
-    table.add_column("Tag\nDiffs", style="yellow", justify="right")
-    table.add_column("Tag Diff\n%", style="bright_yellow", justify="right")
-    table.add_column("Missing\nInstances", style="red", justify="right")
-    table.add_column("Missing\n%", style="bright_red", justify="right")  # New
-    table.add_column("Extra\nInstances", style="magenta", justify="right")
-    table.add_column("Extra\n%", style="bright_magenta", justify="right")  # New
-    table.add_column("Data\nIntegrity", style="bright_blue", justify="right")  # New
+    table.add_column("Perfect\nMatches", style="green", justify="right", no_wrap=True)
+    table.add_column("Tag\nDiffs", style="yellow", justify="right", no_wrap=True)
+    table.add_column("Tag Diff\n%", style="bright_yellow", justify="right", no_wrap=True)
+    table.add_column("Missing\nInstances", style="red", justify="right", no_wrap=True)
+    table.add_column("Missing\n%", style="bright_red", justify="right", no_wrap=True)  # New
+    table.add_column("Extra\nInstances", style="magenta", justify="right", no_wrap=True)
+    table.add_column("Extra\n%", style="bright_magenta", justify="right", no_wrap=True)  # New
+    table.add_column("Data\nIntegrity", style="bright_blue", justify="right", no_wrap=True)  # New
     
     for result in summary.file_results:
-        perfect_matches = sum(1 for comp in result.matched_instances if comp.is_perfect_match)
-        tag_diffs = len(result.matched_instances) - perfect_matches
+        perfect_matches = result.perfect_matches
+        tag_diffs = result.tag_difference_count
         missing = len(result.missing_instances)
         extra = len(result.extra_instances)
         
@@ -740,7 +914,7 @@ def display_terminal_results(summary: 'ComparisonSummary', console: Console) ->
             integrity_style = "red"
         
         table.add_row(
-            Path(result.comparison_file).name,
+            result.comparison_name,
             str(perfect_matches),
             str(tag_diffs),
             f"{tag_diff_pct:.1f}%",
@@ -761,22 +935,12 @@ def display_terminal_results(summary: 'ComparisonSummary', console: Console) ->
 
 def _calculate_data_integrity(result: 'FileComparisonResult') -> float:
     """Calculate overall data integrity score (0-100%)"""
-    total_baseline = result.total_instances_baseline
-    if total_baseline == 0:
-        return 0.0
-    
-    # Perfect matches get full score
-    perfect_matches = sum(1 for comp in result.matched_instances if comp.is_perfect_match)
-    perfect_score = (perfect_matches / total_baseline) * 100
-    
-    # Tag differences get partial score (75% of full score)
-    tag_diffs = len(result.matched_instances) - perfect_matches
-    partial_score = (tag_diffs / total_baseline) * 75
-    
-    # Missing instances get no score
-    # Extra instances don't affect score (they're bonus data)
-    
-    return perfect_score + partial_score
+    return result.data_integrity
+
+def _quality_grade(integrity: float, grades: Tuple[Tuple[float, ...], Tuple[str, ...]]) -> str:
+    """Look up the quality grade for a data integrity score (0-100%)"""
+    thresholds, names = grades
+    return names[bisect.bisect_right(thresholds, integrity)]
 
 def _display_detailed_breakdown(summary: 'ComparisonSummary', console: Console) -> None:
     """Display detailed breakdown of differences"""
@@ -784,8 +948,8 @@ def _display_detailed_breakdown(summary: 'ComparisonSummary', console: Console)
     
     breakdown_table = Table(title="📊 Export Quality Breakdown", show_header=True)
     breakdown_table.add_column("File", style="cyan")
-    breakdown_table.add_column("Instance\nMatch Rate", style="green", justify="right")
-    breakdown_table.add_column("Tag\nPreservation", style="blue", justify="right")
+    breakdown_table.add_column("Instance\nMatch Rate", style="green", justify="right", no_wrap=True)
+    breakdown_table.add_column("Tag\nPreservation", style="blue", justify="right", no_wrap=True)
     breakdown_table.add_column("Quality\nGrade", style="bright_white", justify="center")
     breakdown_table.add_column("Primary Issues", style="yellow")
     
@@ -799,27 +963,14 @@ def _display_detailed_breakdown(summary: 'ComparisonSummary', console: Console)
         
         # Tag preservation rate (for matched instances)
         if matched_instances > 0:
-            perfect_matches = sum(1 for comp in result.matched_instances if comp.is_perfect_match)
+            perfect_matches = result.perfect_matches
             tag_preservation = (perfect_matches / matched_instances * 100)
         else:
             tag_preservation = 0
         
         # Quality grade
         integrity_score = _calculate_data_integrity(result)
-        if integrity_score >= 95:
-            grade = "A+"
-        elif integrity_score >= 90:
-            grade = "A"
-        elif integrity_score >= 85:
-            grade = "B+"
-        elif integrity_score >= 80:
-            grade = "B"
-        elif integrity_score >= 70:
-            grade = "C"
-        elif integrity_score >= 60:
-            grade = "D"
-        else:
-            grade = "F"
+        grade = _quality_grade(integrity_score, QUALITY_GRADES)
         
         # Identify primary issues
         issues = []
@@ -828,7 +979,7 @@ def _display_detailed_breakdown(summary: 'ComparisonSummary', console: Console)
         if len(result.extra_instances) > total_comparison * 0.05:  # >5% extra
             issues.append(f"{len(result.extra_instances)} extra instances")
         
-        tag_diffs = matched_instances - sum(1 for comp in result.matched_instances if comp.is_perfect_match)
+        tag_diffs = result.tag_difference_count
         if tag_diffs > matched_instances * 0.1:  # >10% have tag differences
             issues.append(f"{tag_diffs} instances with tag changes")
         
@@ -836,7 +987,7 @@ def _display_detailed_breakdown(summary: 'ComparisonSummary', console: Console)
             issues.append("None detected")
         
         breakdown_table.add_row(
-            Path(result.comparison_file).name,
+            result.comparison_name,
             f"{instance_match_rate:.1f}%",
             f"{tag_preservation:.1f}%",
             grade,
@@ -848,56 +999,33 @@ def _display_detailed_breakdown(summary: 'ComparisonSummary', console: Console)
 def _display_tag_analysis(summary: 'ComparisonSummary', console: Console) -> None:
     """Display tag-level analysis"""
     
-    # Collect tag difference statistics
-    tag_stats = defaultdict(lambda: {'missing': 0, 'extra': 0, 'value_diff': 0, 'type_diff': 0})
-    total_differences = 0
+    # Tag difference statistics are counted once per summary and shared with the Excel report
+    pair_counts, tag_totals, type_counts = summary.tag_difference_counts
+    total_differences = tag_totals.total()
     
-    for result in summary.file_results:
-        for instance_comp in result.matched_instances:
-            if not instance_comp.is_perfect_match:
-                for tag_diff in instance_comp.tag_differences:
-                    tag_name = tag_diff.tag_keyword
-                    diff_type = tag_diff.difference_type.value
-                    
-                    if diff_type == 'MISSING_TAG':
-                        tag_stats[tag_name]['missing'] += 1
-                    elif diff_type == 'EXTRA_TAG':
-                        tag_stats[tag_name]['extra'] += 1
-                    elif diff_type == 'VALUE_DIFF':
-                        tag_stats[tag_name]['value_diff'] += 1
-                    elif diff_type == 'TYPE_DIFF':
-                        tag_stats[tag_name]['type_diff'] += 1
-                    
-                    total_differences += 1
-    
-    if tag_stats:
+    if tag_totals:
         console.print("\n")
         
         # Tag differences table
         tag_table = Table(title="🏷️ Tag Difference Analysis", show_header=True)
         tag_table.add_column("Tag", style="cyan")
-        tag_table.add_column("Missing", style="red", justify="right")
-        tag_table.add_column("Extra", style="magenta", justify="right")
-        tag_table.add_column("Value\nChanged", style="yellow", justify="right")
-        tag_table.add_column("Type\nChanged", style="orange3", justify="right")
-        tag_table.add_column("Total\nAffected", style="bright_white", justify="right")
-        tag_table.add_column("% of\nDifferences", style="bright_blue", justify="right")
+        tag_table.add_column("Missing", style="red", justify="right", no_wrap=True)
+        tag_table.add_column("Extra", style="magenta", justify="right", no_wrap=True)
+        tag_table.add_column("Value\nChanged", style="yellow", justify="right", no_wrap=True)
+        tag_table.add_column("Type\nChanged", style="orange3", justify="right", no_wrap=True)
+        tag_table.add_column("Total\nAffected", style="bright_white", justify="right", no_wrap=True)
+        tag_table.add_column("% of\nDifferences", style="bright_blue", justify="right", no_wrap=True)
         
         # Sort by total impact
-        sorted_tags = sorted(tag_stats.items(), 
-                           key=lambda x: sum(x[1].values()), 
-                           reverse=True)
+        sorted_tags = tag_totals.most_common()
         
-        for tag_name, stats in sorted_tags[:15]:  # Show top 15
-            total_tag_diffs = sum(stats.values())
+        for tag_name, total_tag_diffs in sorted_tags[:15]:  # Show top 15
             diff_percentage = (total_tag_diffs / total_differences * 100) if total_differences > 0 else 0
+            counts = [pair_counts[tag_name, diff_type] for diff_type in DIFF_TYPE_KEYS]
             
             tag_table.add_row(
                 tag_name,
-                str(stats['missing']) if stats['missing'] > 0 else "-",
-                str(stats['extra']) if stats['extra'] > 0 else "-",
-                str(stats['value_diff']) if stats['value_diff'] > 0 else "-",
-                str(stats['type_diff']) if stats['type_diff'] > 0 else "-",
+                *(str(count) if count > 0 else "-" for count in counts),
                 str(total_tag_diffs),
                 f"{diff_percentage:.1f}%"
             )
@@ -909,21 +1037,14 @@ def _display_tag_analysis(summary: 'ComparisonSummary', console: Console) -> Non
         
         # Summary of difference types
         console.print("\n")
-        _display_difference_type_summary(tag_stats, total_differences, console)
+        _display_difference_type_summary(type_counts, total_differences, console)
 
-def _display_difference_type_summary(tag_stats: dict, total_differences: int, console: Console) -> None:
+def _display_difference_type_summary(type_counts: Counter, total_differences: int, console: Console) -> None:
     """Display summary of difference types"""
-    # Count by difference type
-    type_counts = {'missing': 0, 'extra': 0, 'value_diff': 0, 'type_diff': 0}
-    
-    for stats in tag_stats.values():
-        for diff_type, count in stats.items():
-            type_counts[diff_type] += count
-    
     summary_table = Table(title="📈 Difference Type Summary", show_header=True)
     summary_table.add_column("Difference Type", style="cyan")
-    summary_table.add_column("Count", style="bright_white", justify="right")
-    summary_table.add_column("Percentage", style="bright_blue", justify="right")
+    summary_table.add_column("Count", style="bright_white", justify="right", no_wrap=True)
+    summary_table.add_column("Percentage", style="bright_blue", justify="right", no_wrap=True)
     summary_table.add_column("Impact", style="yellow")
     
     # Define impact descriptions
@@ -934,153 +1055,170 @@ def _display_difference_type_summary(tag_stats: dict, total_differences: int, co
         'type_diff': "Tag data types changed"
     }
     
-    for diff_type, count in type_counts.items():
+    for diff_type, type_key in DIFF_TYPE_KEYS.items():
+        count = type_counts[diff_type]
         if count > 0:
             percentage = (count / total_differences * 100) if total_differences > 0 else 0
             summary_table.add_row(
-                diff_type.replace('_', ' ').title(),
+                type_key.replace('_', ' ').title(),
                 str(count),
                 f"{percentage:.1f}%",
-                impact_descriptions[diff_type]
+                impact_descriptions[type_key]
             )
     
     console.print(summary_table)
 
-def generate_report(summary: ComparisonSummary, report_path: Path) -> None:
-    """Generate CSV or Excel report"""
-    if report_path.suffix.lower() == '.csv':
+def generate_report(summary: ComparisonSummary, report_path: Path) -> Path:
+    """
+    Generate CSV, Excel, Feather or Parquet report
+    
+    Returns:
+        Path of the file actually written, which is a .csv when the requested
+        format's dependencies are missing
+    """
+    suffix = report_path.suffix.lower()
+    if suffix == '.csv':
         generate_csv_report(summary, report_path)
-    elif report_path.suffix.lower() == '.xlsx':
-        generate_excel_report(summary, report_path)
+    elif suffix == '.xlsx':
+        return generate_excel_report(summary, report_path)
+    elif suffix in ('.feather', '.parquet'):
+        return generate_columnar_report(summary, report_path)
+    return report_path
+
+# Column order of every CSV report row (rows are plain tuples in this order)
+CSV_REPORT_FIELDS = (
+    'ReportType', 'BaselineFile', 'ComparisonFile', 'SOPInstanceUID', 'TagName',
+    'TagKeyword', 'BaselineValue', 'ComparisonValue', 'DifferenceType', 'VR'
+)
+
+# Row written in place of the differences when every instance matches
+NO_DIFFERENCES_ROW = (
+    'INFO', 'INFO', 'INFO', 'INFO',
+    'NO_DIFFERENCES_FOUND', 'NO_DIFFERENCES_FOUND',
+    'All instances match perfectly', 'All instances match perfectly',
+    'INFO', 'INFO'
+)
 
 def generate_csv_report(summary: ComparisonSummary, report_path: Path) -> None:
-    """Generate CSV report"""    
-    rows = []
+    """Generate CSV report"""
+    import csv
+    
+    # Stream rows straight to disk rather than collecting them into a DataFrame
+    with open(report_path, 'w', newline='', buffering=CSV_BUFFER_SIZE) as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(CSV_REPORT_FIELDS)
+        
+        # Add summary information first
+        row_count = 0
+        for row in _iter_summary_rows(summary):
+            writer.writerow(row)
+            row_count += 1
+        
+        # Add detailed differences
+        difference_count = 0
+        for row in _iter_difference_rows(summary):
+            writer.writerow(row)
+            difference_count += 1
+        row_count += difference_count
+        
+        # If no differences found, add a note
+        if difference_count == 0:
+            writer.writerow(NO_DIFFERENCES_ROW)
+            row_count += 1
     
-    # Add summary information first
-    summary_rows = []
-    for result in summary.file_results:
-        perfect_matches = sum(1 for comp in result.matched_instances if comp.is_perfect_match)
-        tag_diffs = len(result.matched_instances) - perfect_matches
-        missing = len(result.missing_instances)
-        extra = len(result.extra_instances)
+    console.print(f"📊 Generated {row_count} report rows ({difference_count} actual differences)", style="cyan")
+
+def generate_columnar_report(summary: ComparisonSummary, report_path: Path) -> Path:
+    """
+    Generate a Feather or Parquet report with the same rows as the CSV report
+    
+    Both formats are written through pandas and need pyarrow (the `columnar`
+    extra); without it the report falls back to CSV next to report_path.
+    
+    Returns:
+        Path of the file actually written
+    """
+    try:
+        # Report dependencies are imported lazily so the terminal-only path starts fast
+        import pandas as pd
+        
+        summary_rows = list(_iter_summary_rows(summary))
+        difference_rows = list(_iter_difference_rows(summary))
+        rows = summary_rows + (difference_rows or [NO_DIFFERENCES_ROW])
+        
+        df = pd.DataFrame.from_records(rows, columns=CSV_REPORT_FIELDS)
+        if report_path.suffix.lower() == '.feather':
+            df.to_feather(report_path, compression='lz4')
+        else:
+            df.to_parquet(report_path, compression='zstd', index=False)
         
-        summary_rows.append({
-            'ReportType': 'SUMMARY',
-            'BaselineFile': Path(result.baseline_file).name,
-            'ComparisonFile': Path(result.comparison_file).name,
-            'SOPInstanceUID': 'SUMMARY',
-            'TagName': 'TotalInstances',
-            'TagKeyword': 'TotalInstances',
-            'BaselineValue': str(result.total_instances_baseline),
-            'ComparisonValue': str(result.total_instances_comparison),
-            'DifferenceType': 'SUMMARY',
-            'VR': 'SUMMARY'
-        })
-        
-        summary_rows.append({
-            'ReportType': 'SUMMARY',
-            'BaselineFile': Path(result.baseline_file).name,
-            'ComparisonFile': Path(result.comparison_file).name,
-            'SOPInstanceUID': 'SUMMARY',
-            'TagName': 'PerfectMatches',
-            'TagKeyword': 'PerfectMatches',
-            'BaselineValue': str(perfect_matches),
-            'ComparisonValue': str(perfect_matches),
-            'DifferenceType': 'SUMMARY',
-            'VR': 'SUMMARY'
-        })
-        
-        summary_rows.append({
-            'ReportType': 'SUMMARY',
-            'BaselineFile': Path(result.baseline_file).name,
-            'ComparisonFile': Path(result.comparison_file).name,
-            'SOPInstanceUID': 'SUMMARY',
-            'TagName': 'TagDifferences',
-            'TagKeyword': 'TagDifferences',
-            'BaselineValue': str(tag_diffs),
-            'ComparisonValue': str(tag_diffs),
-            'DifferenceType': 'SUMMARY',
-            'VR': 'SUMMARY'
-        })
-    
-    rows.extend(summary_rows)
-    
-    # Add detailed differences
-    difference_count = 0
+        console.print(f"📊 Generated {len(rows)} report rows ({len(difference_rows)} actual differences)", style="cyan")
+        return report_path
+        
+    except ImportError:
+        console.print(
+            f"📊 {report_path.suffix[1:].title()} output needs pyarrow "
+            f"(pip install 'dicom-compare[columnar]') - generating CSV instead", style="yellow"
+        )
+        csv_path = report_path.with_suffix('.csv')
+        generate_csv_report(summary, csv_path)
+        return csv_path
+
+def _iter_summary_rows(summary: ComparisonSummary):
+    """Yield the per-file SUMMARY rows of the CSV report"""
+    for result in summary.file_results:
+        perfect_matches = result.perfect_matches
+        tag_diffs = result.tag_difference_count
+        baseline_name, comparison_name = result.baseline_name, result.comparison_name
+        
+        for tag_name, baseline_value, comparison_value in (
+            ('TotalInstances', result.total_instances_baseline, result.total_instances_comparison),
+            ('PerfectMatches', perfect_matches, perfect_matches),
+            ('TagDifferences', tag_diffs, tag_diffs),
+        ):
+            yield (
+                'SUMMARY', baseline_name, comparison_name, 'SUMMARY',
+                tag_name, tag_name, str(baseline_value), str(comparison_value),
+                'SUMMARY', 'SUMMARY'
+            )
+
+def _iter_difference_rows(summary: ComparisonSummary):
+    """Yield one CSV row per missing instance, extra instance and tag difference"""
     for result in summary.file_results:
+        baseline_name, comparison_name = result.baseline_name, result.comparison_name
+        
         # Add missing instances
         for missing_instance in result.missing_instances:
-            rows.append({
-                'ReportType': 'MISSING_INSTANCE',
-                'BaselineFile': Path(result.baseline_file).name,
-                'ComparisonFile': Path(result.comparison_file).name,
-                'SOPInstanceUID': missing_instance.sop_instance_uid,
-                'TagName': 'MISSING_INSTANCE',
-                'TagKeyword': 'MISSING_INSTANCE',
-                'BaselineValue': 'EXISTS',
-                'ComparisonValue': 'MISSING',
-                'DifferenceType': 'MISSING_INSTANCE',
-                'VR': 'INSTANCE'
-            })
-            difference_count += 1
+            yield (
+                'MISSING_INSTANCE', baseline_name, comparison_name, missing_instance.sop_instance_uid,
+                'MISSING_INSTANCE', 'MISSING_INSTANCE', 'EXISTS', 'MISSING',
+                'MISSING_INSTANCE', 'INSTANCE'
+            )
         
         # Add extra instances
         for extra_instance in result.extra_instances:
-            rows.append({
-                'ReportType': 'EXTRA_INSTANCE',
-                'BaselineFile': Path(result.baseline_file).name,
-                'ComparisonFile': Path(result.comparison_file).name,
-                'SOPInstanceUID': extra_instance.sop_instance_uid,
-                'TagName': 'EXTRA_INSTANCE',
-                'TagKeyword': 'EXTRA_INSTANCE',
-                'BaselineValue': 'MISSING',
-                'ComparisonValue': 'EXISTS',
-                'DifferenceType': 'EXTRA_INSTANCE',
-                'VR': 'INSTANCE'
-            })
-            difference_count += 1
+            yield (
+                'EXTRA_INSTANCE', baseline_name, comparison_name, extra_instance.sop_instance_uid,
+                'EXTRA_INSTANCE', 'EXTRA_INSTANCE', 'MISSING', 'EXISTS',
+                'EXTRA_INSTANCE', 'INSTANCE'
+            )
         
         # Add tag differences
         for instance_comp in result.matched_instances:
             if not instance_comp.is_perfect_match:
                 for tag_diff in instance_comp.tag_differences:
-                    rows.append({
-                        'ReportType': 'TAG_DIFFERENCE',
-                        'BaselineFile': Path(result.baseline_file).name,
-                        'ComparisonFile': Path(result.comparison_file).name,
-                        'SOPInstanceUID': instance_comp.sop_instance_uid,
-                        'TagName': tag_diff.tag_name,
-                        'TagKeyword': tag_diff.tag_keyword,
-                        'BaselineValue': str(tag_diff.baseline_value) if tag_diff.baseline_value is not None else 'NULL',
-                        'ComparisonValue': str(tag_diff.comparison_value) if tag_diff.comparison_value is not None else 'NULL',
-                        'DifferenceType': tag_diff.difference_type.value,
-                        'VR': tag_diff.vr
-                    })
-                    difference_count += 1
-    
-    # If no differences found, add a note
-    if difference_count == 0:
-        rows.append({
-            'ReportType': 'INFO',
-            'BaselineFile': 'INFO',
-            'ComparisonFile': 'INFO',
-            'SOPInstanceUID': 'INFO',
-            'TagName': 'NO_DIFFERENCES_FOUND',
-            'TagKeyword': 'NO_DIFFERENCES_FOUND',
-            'BaselineValue': 'All instances match perfectly',
-            'ComparisonValue': 'All instances match perfectly',
-            'DifferenceType': 'INFO',
-            'VR': 'INFO'
-        })
-    
-    console.print(f"📊 Generated {len(rows)} report rows ({difference_count} actual differences)", style="cyan")
-    
-    df = pd.DataFrame(rows)
-    df.to_csv(report_path, index=False)
-
-def generate_excel_report(summary: 'ComparisonSummary', report_path: Path) -> None:
-    """Generate comprehensive Excel report with charts and summary data"""
+                    yield (
+                        'TAG_DIFFERENCE', baseline_name, comparison_name, instance_comp.sop_instance_uid,
+                        tag_diff.tag_name,
+                        tag_diff.tag_keyword,
+                        str(tag_diff.baseline_value) if tag_diff.baseline_value is not None else 'NULL',
+                        str(tag_diff.comparison_value) if tag_diff.comparison_value is not None else 'NULL',
+                        tag_diff.difference_type.value,
+                        tag_diff.vr
+                    )
+
+def generate_excel_report(summary: 'ComparisonSummary', report_path: Path) -> Path:
+    """Generate comprehensive Excel report with charts and summary data, returning the path written"""
     #if not EXCEL_AVAILABLE:
     #    console.print("📊 Excel dependencies not available - generating CSV instead", style="yellow")
     #    csv_path = report_path.with_suffix('.csv')
@@ -1088,14 +1226,14 @@ def generate_excel_report(summary: 'ComparisonSummary', report_path: Path) -> No
     #    return
     
     try:
+        # Report dependencies are imported lazily so the terminal-only path starts fast
+        import openpyxl
+
         console.print("📊 Creating Excel report with charts...", style="cyan")
         
-        # Create workbook
-        wb = openpyxl.Workbook()
-        
-        # Remove default sheet
-        if 'Sheet' in wb.sheetnames:
-            wb.remove(wb['Sheet'])
+        # Write-only workbooks stream rows to disk instead of keeping a cell object
+        # per value, and start without a default sheet
+        wb = openpyxl.Workbook(write_only=True)
         
         # Create worksheets
         summary_ws = wb.create_sheet("Executive Summary")
@@ -1112,137 +1250,193 @@ def generate_excel_report(summary: 'ComparisonSummary', report_path: Path) -> No
         # Save workbook
         wb.save(report_path)
         console.print(f"✅ Excel report saved: {report_path}", style="green")
+        return report_path
         
     except Exception as e:
         console.print(f"📊 Excel generation failed: {e} - generating CSV instead", style="yellow")
         csv_path = report_path.with_suffix('.csv')
         generate_csv_report(summary, csv_path)
-
-def _auto_adjust_column_widths(ws, min_width: int = 10, max_width: int = 60) -> None:
+        return csv_path
+
+def _styled_cell(ws, value, font=None, fill=None, alignment=None):
+    """Create a write-only cell carrying the given styles"""
+    from openpyxl.cell import WriteOnlyCell
+
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+def _set_row_cell(rows: List[list], row: int, column: int, value) -> None:
+    """Place a value at a 1-based row/column of a sheet that has not been written yet"""
+    while len(rows) < row:
+        rows.append([])
+    cells = rows[row - 1]
+    if len(cells) < column:
+        cells.extend([None] * (column - len(cells)))
+    cells[column - 1] = value
+
+def _auto_adjust_column_widths(ws, rows: List[list], min_width: int = 10, max_width: int = 60) -> None:
     """
     Enhanced auto-adjust column widths based on content
+    
+    Write-only sheets cannot be read back, so the rows are measured before they are appended.
     """
-    # Dictionary to track the maximum content length per column
+    from openpyxl.cell.cell import Cell
+    from openpyxl.utils import get_column_letter
+
+    # Dictionary to track the maximum content length per column number
     column_widths = {}
     
     # Iterate through all rows and columns to find content
-    for row in ws.iter_rows():
-        for cell in row:
-            if cell.value is not None:
-                column_letter = cell.column_letter
-                
+    for row in rows:
+        for column, cell in enumerate(row, 1):
+            value, font = (cell.value, cell.font) if isinstance(cell, Cell) else (cell, None)
+            if value is not None:
                 # Convert value to string and measure length
-                cell_value = str(cell.value)
+                cell_value = str(value)
                 
                 # Add extra space for headers and bold text
-                if cell.font and cell.font.bold:
+                if font and font.bold:
                     content_length = len(cell_value) + 4  # Extra padding for headers
-                elif cell.font and cell.font.size and cell.font.size > 12:
+                elif font and font.size and font.size > 12:
                     content_length = len(cell_value) + 2  # Extra padding for large text
                 else:
                     content_length = len(cell_value)
                 
                 # Track the maximum width needed for this column
-                if column_letter not in column_widths:
-                    column_widths[column_letter] = content_length
+                if column not in column_widths:
+                    column_widths[column] = content_length
                 else:
-                    column_widths[column_letter] = max(column_widths[column_letter], content_length)
+                    column_widths[column] = max(column_widths[column], content_length)
     
     # Apply the calculated widths
-    for column_letter, width in column_widths.items():
+    for column, width in column_widths.items():
         # Apply min/max constraints
         final_width = max(min_width, min(width + 5, max_width))  # +2 for padding
-        ws.column_dimensions[column_letter].width = final_width
+        ws.column_dimensions[get_column_letter(column)].width = final_width
         
         # Optional: Show what widths are being applied
         #if ws.title == "Executive Summary":  # Only show for summary sheet
         #    console.print(f"   📏 Column {column_letter}: {final_width} chars", style="dim")
 
+def _set_capped_column_widths(ws, rows, max_width: int) -> None:
+    """Size each column to its longest value plus padding, up to max_width"""
+    from openpyxl.utils import get_column_letter
+
+    max_lengths = {}
+    for row in rows:
+        for column, value in enumerate(row, 1):
+            max_lengths[column] = max(max_lengths.get(column, 0), len(str(value)))
+    
+    for column, max_length in max_lengths.items():
+        ws.column_dimensions[get_column_letter(column)].width = min(max_length + 2, max_width)
+
 def _create_summary_worksheet(ws, summary: 'ComparisonSummary', wb) -> None:
     """Create executive summary worksheet with charts and auto-sized columns"""
-    # Set worksheet title
-    ws.title = "Executive Summary"
-    
+    from openpyxl.styles import Font, PatternFill, Alignment
+    from datetime import datetime
+
     # Header styling
-    header_font = Font(name='Calibri', size=16, bold=True, color='FFFFFF')
-    header_fill = PatternFill(start_color='2F5597', end_color='2F5597', fill_type='solid')
-    subheader_font = Font(name='Calibri', size=12, bold=True, color='2F5597')
+    header_font = Font(name='Calibri', size=16, bold=True, color='FFFFFFFF')
+    header_fill = PatternFill(start_color='FF2F5597', end_color='FF2F5597', fill_type='solid')
+    subheader_font = Font(name='Calibri', size=12, bold=True, color='FF2F5597')
+    
+    # The sheet is streamed top to bottom, so lay out every row (including chart
+    # data) first; column widths must be known before the first row is written
+    rows = []
     
     # Title
-    ws['A1'] = "DICOM Comparison Report - Executive Summary"
-    ws['A1'].font = Font(name='Calibri', size=18, bold=True, color='2F5597')
-    ws.merge_cells('A1:H1')
+    rows.append([_styled_cell(ws, "DICOM Comparison Report - Executive Summary",
+                              font=Font(name='Calibri', size=18, bold=True, color='FF2F5597'))])
+    ws.merged_cells.add('A1:H1')
+    rows.append([])
     
     # Basic information section
-    ws['A3'] = "Report Information"
-    ws['A3'].font = subheader_font
+    rows.append([_styled_cell(ws, "Report Information", font=subheader_font)])
     
     info_data = [
         ("Baseline File:", Path(summary.baseline_file).name),
         ("Comparison Files:", f"{len(summary.comparison_files)} files"),
         ("Total Instances:", summary.total_instances),
         ("Total Studies:", summary.total_studies),
-        ("Generated:", pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S"))
+        ("Generated:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     ]
     
-    for idx, (label, value) in enumerate(info_data, 4):
-        ws.cell(row=idx, column=1, value=label).font = Font(bold=True)
-        ws.cell(row=idx, column=2, value=value)
+    label_font = Font(bold=True)
+    for label, value in info_data:
+        rows.append([_styled_cell(ws, label, font=label_font), value])
     
     # Comparison Summary Table
-    ws['A9'] = "Comparison Summary"
-    ws['A9'].font = subheader_font
+    rows.append([_styled_cell(ws, "Comparison Summary", font=subheader_font)])
     
     # Create summary table headers
     headers = ["File Name", "Perfect Matches", "Tag Differences", "Missing Instances", "Extra Instances", "Data Integrity %"]
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=10, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center')
+    header_alignment = Alignment(horizontal='center')
+    rows.append([
+        _styled_cell(ws, header, font=header_font, fill=header_fill, alignment=header_alignment)
+        for header in headers
+    ])
+    
+    good_fill = PatternFill(start_color='FFC6EFCE', end_color='FFC6EFCE', fill_type='solid')
+    fair_fill = PatternFill(start_color='FFFFEB9C', end_color='FFFFEB9C', fill_type='solid')
+    poor_fill = PatternFill(start_color='FFFFC7CE', end_color='FFFFC7CE', fill_type='solid')
     
     # Populate summary data with better formatting
-    for row_idx, result in enumerate(summary.file_results, 11):
-        perfect_matches = sum(1 for comp in result.matched_instances if comp.is_perfect_match)
-        tag_diffs = len(result.matched_instances) - perfect_matches
+    for result in summary.file_results:
+        perfect_matches = result.perfect_matches
+        tag_diffs = result.tag_difference_count
         missing = len(result.missing_instances)
         extra = len(result.extra_instances)
         integrity = _calculate_data_integrity(result)
         
         # File name (truncated if too long)
-        file_name = Path(result.comparison_file).name
+        file_name = result.comparison_name
         if len(file_name) > 30:
             file_name = file_name[:27] + "..."
         
-        ws.cell(row=row_idx, column=1, value=file_name)
-        ws.cell(row=row_idx, column=2, value=perfect_matches)
-        ws.cell(row=row_idx, column=3, value=tag_diffs)
-        ws.cell(row=row_idx, column=4, value=missing)
-        ws.cell(row=row_idx, column=5, value=extra)
-        
         # Format integrity percentage with color coding
-        integrity_cell = ws.cell(row=row_idx, column=6, value=f"{integrity:.1f}%")
         if integrity >= 95:
-            integrity_cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+            integrity_fill = good_fill
         elif integrity >= 85:
-            integrity_cell.fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
+            integrity_fill = fair_fill
         else:
-            integrity_cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+            integrity_fill = poor_fill
+        
+        rows.append([
+            file_name,
+            perfect_matches,
+            tag_diffs,
+            missing,
+            extra,
+            _styled_cell(ws, f"{integrity:.1f}%", fill=integrity_fill)
+        ])
     
     # Add charts
     try:
         chart_start_row = len(summary.file_results) + 13
-        _add_data_integrity_chart(ws, summary, start_row=chart_start_row)
-        _add_comparison_breakdown_chart(ws, summary, start_row=chart_start_row, start_col=7)
+        _add_data_integrity_chart(ws, rows, summary, start_row=chart_start_row)
+        _add_comparison_breakdown_chart(ws, rows, summary, start_row=chart_start_row, start_col=7)
     except Exception as e:
         console.print(f"⚠️  Chart creation failed: {e}", style="yellow")
     
     # Auto-adjust ALL column widths based on content
     console.print("📏 Auto-sizing columns...", style="cyan")
-    _auto_adjust_column_widths(ws)
+    _auto_adjust_column_widths(ws, rows)
+    
+    for row in rows:
+        ws.append(row)
 
-def _add_data_integrity_chart(ws, summary: 'ComparisonSummary', start_row: int) -> None:
+def _add_data_integrity_chart(ws, rows: List[list], summary: 'ComparisonSummary', start_row: int) -> None:
     """Add data integrity pie chart"""
+    from openpyxl.chart import PieChart, Reference
+    from openpyxl.chart.series import DataPoint
+    from openpyxl.chart.shapes import GraphicalProperties
+
     try:
         chart = PieChart()
         chart.title = "Data Integrity Overview"
@@ -1255,8 +1449,8 @@ def _add_data_integrity_chart(ws, summary: 'ComparisonSummary', start_row: int)
         total_missing = 0
         
         for result in summary.file_results:
-            perfect_matches = sum(1 for comp in result.matched_instances if comp.is_perfect_match)
-            tag_diffs = len(result.matched_instances) - perfect_matches
+            perfect_matches = result.perfect_matches
+            tag_diffs = result.tag_difference_count
             missing = len(result.missing_instances)
             
             total_perfect += perfect_matches
@@ -1275,7 +1469,7 @@ def _add_data_integrity_chart(ws, summary: 'ComparisonSummary', start_row: int)
         chart_start_row = start_row
         for row_idx, row_data in enumerate(chart_data):
             for col_idx, value in enumerate(row_data):
-                ws.cell(row=chart_start_row + row_idx, column=1 + col_idx, value=value)
+                _set_row_cell(rows, chart_start_row + row_idx, 1 + col_idx, value)
         
         # Create chart reference
         data_ref = Reference(ws, min_col=2, min_row=chart_start_row + 1, max_row=chart_start_row + len(chart_data) - 1)
@@ -1284,26 +1478,24 @@ def _add_data_integrity_chart(ws, summary: 'ComparisonSummary', start_row: int)
         chart.add_data(data_ref, titles_from_data=False)
         chart.set_categories(labels_ref)
         
-        # Simplified color coding (skip if it causes issues)
-        try:
-            if chart.series and len(chart.series) > 0:
-                colors = ['00B050', 'FFC000', 'C5504B']  # Green, Orange, Red
-                series = chart.series[0]
-                for i, color in enumerate(colors):
-                    if i < len(chart_data) - 1:  # Skip header
-                        point = DataPoint(idx=i)
-                        point.graphicalProperties.solidFill = color
-                        series.data_points.append(point)
-        except Exception as color_error:
-            console.print(f"⚠️  Chart coloring skipped: {color_error}", style="dim")
+        # Color the three slices: green, orange, red
+        if chart.series:
+            colors = ['00B050', 'FFC000', 'C5504B']
+            chart.series[0].data_points = [
+                DataPoint(idx=i, spPr=GraphicalProperties(solidFill=color))
+                for i, color in enumerate(colors)
+            ]
         
         ws.add_chart(chart, f"A{start_row + 5}")
         
     except Exception as e:
         console.print(f"⚠️  Pie chart creation failed: {e}", style="yellow")
 
-def _add_comparison_breakdown_chart(ws, summary: 'ComparisonSummary', start_row: int, start_col: int) -> None:
+def _add_comparison_breakdown_chart(ws, rows: List[list], summary: 'ComparisonSummary', start_row: int, start_col: int) -> None:
     """Add comparison breakdown bar chart"""
+    from openpyxl.chart import BarChart, Reference
+    from openpyxl.utils import get_column_letter
+
     try:
         chart = BarChart()
         chart.title = "File Comparison Breakdown"
@@ -1319,10 +1511,10 @@ def _add_comparison_breakdown_chart(ws, summary: 'ComparisonSummary', start_row:
         missing_instances = []
         
         for result in summary.file_results:
-            file_names.append(Path(result.comparison_file).name[:15])  # Truncate long names
-            perfect_count = sum(1 for comp in result.matched_instances if comp.is_perfect_match)
+            file_names.append(result.comparison_name[:15])  # Truncate long names
+            perfect_count = result.perfect_matches
             perfect_matches.append(perfect_count)
-            tag_diffs.append(len(result.matched_instances) - perfect_count)
+            tag_diffs.append(result.tag_difference_count)
             missing_instances.append(len(result.missing_instances))
         
         # Create data table with series labels in first column
@@ -1343,7 +1535,7 @@ def _add_comparison_breakdown_chart(ws, summary: 'ComparisonSummary', start_row:
         chart_start_col = start_col
         for row_idx, row_data in enumerate(chart_data):
             for col_idx, value in enumerate(row_data):
-                ws.cell(row=start_row + row_idx, column=chart_start_col + col_idx, value=value)
+                _set_row_cell(rows, start_row + row_idx, chart_start_col + col_idx, value)
         
         # Create chart references
         # Categories are the file names (first column, excluding header)
@@ -1363,7 +1555,7 @@ def _add_comparison_breakdown_chart(ws, summary: 'ComparisonSummary', start_row:
         chart.set_categories(categories_ref)
         
         # Add chart to worksheet
-        col_letter = openpyxl.utils.get_column_letter(start_col)
+        col_letter = get_column_letter(start_col)
         ws.add_chart(chart, f"{col_letter}{start_row + len(file_names) + 3}")
         
     except Exception as e:
@@ -1371,8 +1563,8 @@ def _add_comparison_breakdown_chart(ws, summary: 'ComparisonSummary', start_row:
 
 def _create_comparison_worksheet(ws, summary: 'ComparisonSummary') -> None:
     """Create detailed comparison results worksheet"""
-    ws.title = "Comparison Results"
-    
+    from openpyxl.styles import Font, PatternFill, Alignment
+
     # Create detailed comparison data
     data = []
     headers = ["File", "Total Instances", "Perfect Matches", "Perfect Match %", 
@@ -1381,8 +1573,8 @@ def _create_comparison_worksheet(ws, summary: 'ComparisonSummary') -> None:
     data.append(headers)
     
     for result in summary.file_results:
-        perfect_matches = sum(1 for comp in result.matched_instances if comp.is_perfect_match)
-        tag_diffs = len(result.matched_instances) - perfect_matches
+        perfect_matches = result.perfect_matches
+        tag_diffs = result.tag_difference_count
         missing = len(result.missing_instances)
         extra = len(result.extra_instances)
         
@@ -1397,21 +1589,10 @@ def _create_comparison_worksheet(ws, summary: 'ComparisonSummary') -> None:
         integrity = _calculate_data_integrity(result)
         
         # Quality grade
-        if integrity >= 95:
-            grade = "A+"
-        elif integrity >= 90:
-            grade = "A"
-        elif integrity >= 85:
-            grade = "B+"
-        elif integrity >= 80:
-            grade = "B"
-        elif integrity >= 70:
-            grade = "C"
-        else:
-            grade = "D"
+        grade = _quality_grade(integrity, EXCEL_QUALITY_GRADES)
         
         row = [
-            Path(result.comparison_file).name,
+            result.comparison_name,
             total_comparison,
             perfect_matches,
             round(perfect_pct, 1),
@@ -1426,73 +1607,45 @@ def _create_comparison_worksheet(ws, summary: 'ComparisonSummary') -> None:
         ]
         data.append(row)
     
-    # Add data to worksheet
-    for row_idx, row_data in enumerate(data):
-        for col_idx, value in enumerate(row_data):
-            cell = ws.cell(row=row_idx + 1, column=col_idx + 1, value=value)
-            
-            # Header formatting
-            if row_idx == 0:
-                cell.font = Font(bold=True, color='FFFFFF')
-                cell.fill = PatternFill(start_color='2F5597', end_color='2F5597', fill_type='solid')
-                cell.alignment = Alignment(horizontal='center')
-            
-            # Conditional formatting for quality grades
-            elif col_idx == 11:  # Quality grade column
-                if value in ['A+', 'A']:
-                    cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-                elif value in ['B+', 'B']:
-                    cell.fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-                else:
-                    cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-    
     # Auto-adjust column widths
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 20)
-        ws.column_dimensions[column_letter].width = adjusted_width
+    _set_capped_column_widths(ws, data, 20)
+    
+    header_font = Font(bold=True, color='FFFFFFFF')
+    header_fill = PatternFill(start_color='FF2F5597', end_color='FF2F5597', fill_type='solid')
+    header_alignment = Alignment(horizontal='center')
+    grade_fills = {
+        'good': PatternFill(start_color='FFC6EFCE', end_color='FFC6EFCE', fill_type='solid'),
+        'fair': PatternFill(start_color='FFFFEB9C', end_color='FFFFEB9C', fill_type='solid'),
+        'poor': PatternFill(start_color='FFFFC7CE', end_color='FFFFC7CE', fill_type='solid'),
+    }
+    
+    # Add data to worksheet
+    ws.append([_styled_cell(ws, header, font=header_font, fill=header_fill, alignment=header_alignment)
+               for header in data[0]])
+    for row_data in data[1:]:
+        # Conditional formatting for quality grades
+        grade = row_data[11]
+        if grade in ['A+', 'A']:
+            grade_fill = grade_fills['good']
+        elif grade in ['B+', 'B']:
+            grade_fill = grade_fills['fair']
+        else:
+            grade_fill = grade_fills['poor']
+        ws.append(row_data[:11] + [_styled_cell(ws, grade, fill=grade_fill)])
 
 def _create_tag_analysis_worksheet(ws, summary: 'ComparisonSummary') -> None:
     """Create tag analysis worksheet"""
-    
-    ws.title = "Tag Analysis"
+    from openpyxl.styles import Font, PatternFill, Alignment
     
     # Collect tag statistics
-    tag_stats = defaultdict(lambda: {'missing': 0, 'extra': 0, 'value_diff': 0, 'type_diff': 0})
-    
-    for result in summary.file_results:
-        for instance_comp in result.matched_instances:
-            if not instance_comp.is_perfect_match:
-                for tag_diff in instance_comp.tag_differences:
-                    tag_name = tag_diff.tag_keyword
-                    diff_type = tag_diff.difference_type.value
-                    
-                    if diff_type == 'MISSING_TAG':
-                        tag_stats[tag_name]['missing'] += 1
-                    elif diff_type == 'EXTRA_TAG':
-                        tag_stats[tag_name]['extra'] += 1
-                    elif diff_type == 'VALUE_DIFF':
-                        tag_stats[tag_name]['value_diff'] += 1
-                    elif diff_type == 'TYPE_DIFF':
-                        tag_stats[tag_name]['type_diff'] += 1
+    pair_counts, tag_totals, _ = summary.tag_difference_counts
     
     # Create data
     headers = ["Tag Name", "Missing Count", "Extra Count", "Value Changed", "Type Changed", "Total Affected", "Impact Level"]
     data = [headers]
     
     # Sort by total impact
-    sorted_tags = sorted(tag_stats.items(), key=lambda x: sum(x[1].values()), reverse=True)
-    
-    for tag_name, stats in sorted_tags:
-        total_affected = sum(stats.values())
-        
+    for tag_name, total_affected in tag_totals.most_common():
         # Determine impact level
         if total_affected > 100:
             impact = "High"
@@ -1503,126 +1656,65 @@ def _create_tag_analysis_worksheet(ws, summary: 'ComparisonSummary') -> None:
         
         row = [
             tag_name,
-            stats['missing'],
-            stats['extra'],
-            stats['value_diff'],
-            stats['type_diff'],
+            *(pair_counts[tag_name, diff_type] for diff_type in DIFF_TYPE_KEYS),
             total_affected,
             impact
         ]
         data.append(row)
     
-    # Add to worksheet with formatting
-    for row_idx, row_data in enumerate(data):
-        for col_idx, value in enumerate(row_data):
-            cell = ws.cell(row=row_idx + 1, column=col_idx + 1, value=value)
-            
-            if row_idx == 0:  # Header
-                cell.font = Font(bold=True, color='FFFFFF')
-                cell.fill = PatternFill(start_color='2F5597', end_color='2F5597', fill_type='solid')
-                cell.alignment = Alignment(horizontal='center')
-            elif col_idx == 6:  # Impact level
-                if value == "High":
-                    cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-                elif value == "Medium":
-                    cell.fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-                else:
-                    cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-    
     # Auto-adjust columns
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 25)
-        ws.column_dimensions[column_letter].width = adjusted_width
+    _set_capped_column_widths(ws, data, 25)
+    
+    header_font = Font(bold=True, color='FFFFFFFF')
+    header_fill = PatternFill(start_color='FF2F5597', end_color='FF2F5597', fill_type='solid')
+    header_alignment = Alignment(horizontal='center')
+    impact_fills = {
+        "High": PatternFill(start_color='FFFFC7CE', end_color='FFFFC7CE', fill_type='solid'),
+        "Medium": PatternFill(start_color='FFFFEB9C', end_color='FFFFEB9C', fill_type='solid'),
+        "Low": PatternFill(start_color='FFC6EFCE', end_color='FFC6EFCE', fill_type='solid'),
+    }
+    
+    # Add to worksheet with formatting
+    ws.append([_styled_cell(ws, header, font=header_font, fill=header_fill, alignment=header_alignment)
+               for header in data[0]])
+    for row_data in data[1:]:
+        impact = row_data[6]
+        ws.append(row_data[:6] + [_styled_cell(ws, impact, fill=impact_fills[impact])])
 
 def _create_detailed_worksheet(ws, summary: 'ComparisonSummary') -> None:
     """Create detailed differences worksheet (same as CSV data)"""
-    ws.title = "Detailed Differences"
-    
-    # Create detailed differences data (same as CSV)
-    rows = []
-    headers = ['ReportType', 'BaselineFile', 'ComparisonFile', 'SOPInstanceUID', 'TagName', 'TagKeyword', 'BaselineValue', 'ComparisonValue', 'DifferenceType', 'VR']
-    rows.append(headers)
-    
-    for result in summary.file_results:
-        # Add missing instances
-        for missing_instance in result.missing_instances:
-            rows.append([
-                'MISSING_INSTANCE',
-                Path(result.baseline_file).name,
-                Path(result.comparison_file).name,
-                missing_instance.sop_instance_uid,
-                'MISSING_INSTANCE',
-                'MISSING_INSTANCE',
-                'EXISTS',
-                'MISSING',
-                'MISSING_INSTANCE',
-                'INSTANCE'
-            ])
-        
-        # Add extra instances
-        for extra_instance in result.extra_instances:
-            rows.append([
-                'EXTRA_INSTANCE',
-                Path(result.baseline_file).name,
-                Path(result.comparison_file).name,
-                extra_instance.sop_instance_uid,
-                'EXTRA_INSTANCE',
-                'EXTRA_INSTANCE',
-                'MISSING',
-                'EXISTS',
-                'EXTRA_INSTANCE',
-                'INSTANCE'
-            ])
-        
-        # Add tag differences
-        for instance_comp in result.matched_instances:
-            if not instance_comp.is_perfect_match:
-                for tag_diff in instance_comp.tag_differences:
-                    rows.append([
-                        'TAG_DIFFERENCE',
-                        Path(result.baseline_file).name,
-                        Path(result.comparison_file).name,
-                        instance_comp.sop_instance_uid,
-                        tag_diff.tag_name,
-                        tag_diff.tag_keyword,
-                        str(tag_diff.baseline_value) if tag_diff.baseline_value is not None else 'NULL',
-                        str(tag_diff.comparison_value) if tag_diff.comparison_value is not None else 'NULL',
-                        tag_diff.difference_type.value,
-                        tag_diff.vr
-                    ])
+    from openpyxl.styles import Font, PatternFill, Alignment
+
+    # Detailed differences are the CSV difference rows; they are generated twice
+    # (once to size the columns, once to write) rather than held in memory
+    _set_capped_column_widths(ws, chain([CSV_REPORT_FIELDS], _iter_difference_rows(summary)), 30)
     
     # Add to worksheet
-    for row_idx, row_data in enumerate(rows):
-        for col_idx, value in enumerate(row_data):
-            cell = ws.cell(row=row_idx + 1, column=col_idx + 1, value=value)
-            
-            if row_idx == 0:  # Header
-                cell.font = Font(bold=True, color='FFFFFF')
-                cell.fill = PatternFill(start_color='2F5597', end_color='2F5597', fill_type='solid')
-                cell.alignment = Alignment(horizontal='center')
-    
-    # Auto-adjust columns
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 30)
-        ws.column_dimensions[column_letter].width = adjusted_width
+    header_font = Font(bold=True, color='FFFFFFFF')
+    header_fill = PatternFill(start_color='FF2F5597', end_color='FF2F5597', fill_type='solid')
+    header_alignment = Alignment(horizontal='center')
+    ws.append([_styled_cell(ws, header, font=header_font, fill=header_fill, alignment=header_alignment)
+               for header in CSV_REPORT_FIELDS])
+    for row in _iter_difference_rows(summary):
+        ws.append(row)
 
 # Helper functions for inspect commands
+def _find_by_id(items: dict, query: str, ignore_case: bool = False) -> Optional[Tuple[str, Any]]:
+    """
+    Find an entry by exact ID, falling back to the first ID containing the query
+    
+    The exact lookup comes first so a full UID is never shadowed by a longer UID
+    that merely contains it.
+    """
+    if query in items:
+        return query, items[query]
+    
+    needle = query.lower() if ignore_case else query
+    for key, value in items.items():
+        if needle in (key.lower() if ignore_case else key):
+            return key, value
+    return None
+
 
 def _display_search_results_brief(results: List, query: str, console: Console):
     """Display search results in brief format"""
@@ -1649,7 +1741,7 @@ def _display_search_results_brief(results: List, query: str, console: Console):
 def _list_available_patients(patients: dict, console: Console):
     """List available patients"""
     console.print(f"\nAvailable patients ({len(patients)}):")
-    for i, (patient_id, patient) in enumerate(list(patients.items())[:10]):
+    for i, (patient_id, patient) in enumerate(islice(patients.items(), 10)):
         name = patient.demographics.get('PatientName', 'UNKNOWN')
         if hasattr(name, 'value'):
             name = name.value
@@ -1661,7 +1753,7 @@ def _list_available_patients(patients: dict, console: Console):
 def _list_available_studies(studies: dict, console: Console):
     """List available studies"""
     console.print(f"\nAvailable studies ({len(studies)}):")
-    for i, (study_uid, study) in enumerate(list(studies.items())[:10]):
+    for i, (study_uid, study) in enumerate(islice(studies.items(), 10)):
         desc = study.metadata.get('StudyDescription', 'UNKNOWN')
         if hasattr(desc, 'value'):
             desc = desc.value
@@ -1673,7 +1765,7 @@ def _list_available_studies(studies: dict, console: Console):
 def _list_available_series(series: dict, console: Console):
     """List available series"""
     console.print(f"\nAvailable series ({len(series)}):")
-    for i, (series_uid, series) in enumerate(list(series.items())[:10]):
+    for i, (series_uid, series) in enumerate(islice(series.items(), 10)):
         desc = series.metadata.get('SeriesDescription', 'UNKNOWN')
         modality = series.metadata.get('Modality', 'UNKNOWN')
         if hasattr(desc, 'value'):
@@ -1688,7 +1780,7 @@ def _list_available_series(series: dict, console: Console):
 def _list_available_instances(instances: dict, console: Console, limit: int = 10):
     """List available instances"""
     console.print(f"\nAvailable instances ({len(instances)} total, showing {min(limit, len(instances))}):")
-    for i, (sop_uid, instance) in enumerate(list(instances.items())[:limit]):
+    for i, (sop_uid, instance) in enumerate(islice(instances.items(), limit)):
         instance_num = instance.metadata.get('InstanceNumber', 'UNKNOWN')
         if hasattr(instance_num, 'value'):
             instance_num = instance_num.value
@@ -1,8 +1,12 @@
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Set
+from functools import cached_property
+from typing import Dict, List, Any, Optional, Set, Tuple
 from pathlib import Path
 from enum import Enum
 
+import numpy as np
+
 class DifferenceType(Enum):
     VALUE_DIFF = "VALUE_DIFF"
     MISSING_TAG = "MISSING_TAG"
@@ -45,6 +49,43 @@ class FileComparisonResult:
     total_instances_baseline: int
     total_instances_comparison: int
 
+    @cached_property
+    def baseline_name(self) -> str:
+        """File name of the baseline ZIP, for display"""
+        return Path(self.baseline_file).name
+
+    @cached_property
+    def comparison_name(self) -> str:
+        """File name of the comparison ZIP, for display"""
+        return Path(self.comparison_file).name
+
+    @cached_property
+    def perfect_mask(self) -> np.ndarray:
+        """Boolean mask over matched_instances marking perfect matches"""
+        return np.fromiter(
+            (comp.is_perfect_match for comp in self.matched_instances),
+            dtype=bool, count=len(self.matched_instances)
+        )
+
+    @cached_property
+    def perfect_matches(self) -> int:
+        """Matched instances with no tag differences (counted once, reused by every report)"""
+        return int(np.count_nonzero(self.perfect_mask))
+
+    @property
+    def tag_difference_count(self) -> int:
+        """Matched instances with at least one tag difference"""
+        return len(self.matched_instances) - self.perfect_matches
+
+    @cached_property
+    def data_integrity(self) -> float:
+        """Overall data integrity score (0-100%), shared by every report"""
+        if self.total_instances_baseline == 0:
+            return 0.0
+        total_baseline = self.total_instances_baseline
+        # Perfect matches get full score, tag differences 75%; missing/extra instances get none
+        return (self.perfect_matches / total_baseline) * 100 + (self.tag_difference_count / total_baseline) * 75
+
 @dataclass
 class ComparisonSummary:
     baseline_file: str
@@ -54,6 +95,28 @@ class ComparisonSummary:
     total_studies: int
     total_series: int
 
+    @cached_property
+    def tag_difference_counts(self) -> Tuple[Counter, Counter, Counter]:
+        """
+        Tag difference counts, gathered in one walk shared by every report
+        
+        Returns:
+            Counters keyed by (tag keyword, DifferenceType), by tag keyword, and by DifferenceType
+        """
+        pair_counts = Counter()
+        tag_totals = Counter()
+        type_counts = Counter()
+        
+        for result in self.file_results:
+            for instance_comp in result.matched_instances:
+                if not instance_comp.is_perfect_match:
+                    for tag_diff in instance_comp.tag_differences:
+                        pair_counts[tag_diff.tag_keyword, tag_diff.difference_type] += 1
+                        tag_totals[tag_diff.tag_keyword] += 1
+                        type_counts[tag_diff.difference_type] += 1
+        
+        return pair_counts, tag_totals, type_counts
+
 # Hierarchical inspection models
 @dataclass
 class TagInfo:
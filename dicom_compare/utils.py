@@ -1,8 +1,12 @@
+import multiprocessing
 import tempfile
 import shutil
 from pathlib import Path
 from typing import List
 
+# Write buffer for streamed CSV reports (the default 8 KiB means a write syscall every few rows)
+CSV_BUFFER_SIZE = 1 << 20
+
 def validate_inputs(files: List[Path]) -> None:
     """Validate CLI inputs"""
     if len(files) < 2:
@@ -26,4 +30,15 @@ def cleanup_temp_dirs(temp_dirs: List[Path]) -> None:
     """Clean up temporary directories"""
     for temp_dir in temp_dirs:
         if temp_dir.exists():
-            shutil.rmtree(temp_dir, ignore_errors=True)
\ No newline at end of file
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+def worker_context():
+    """
+    Multiprocessing context for worker process pools
+    
+    Workers may be started while extraction threads are running, and forking a
+    threaded process can leave a child stuck on a lock one of those threads held,
+    so they are started from a clean forkserver (or spawned where that's unavailable).
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')